@@ -4,6 +4,9 @@ Example usage of Worker Management tools for Resource Manager MCP Server
 This file demonstrates how to use the worker management functionality.
 """
 
+import operator
+import sys
+
 from src.worker_manager import WorkerManager, WorkerManagerError
 
 
@@ -25,8 +28,11 @@ def main():
     print("=" * 80)
 
     # Example 1: List all workers
+    # One LIST round-trip serves examples 1-3 and 5; the type filters below
+    # are applied client-side instead of re-listing per filter.
     print("\n1. Listing all workers:")
     print("-" * 80)
+    all_workers = []
     try:
         all_workers = manager.list_workers()
         print(f"Total workers: {len(all_workers)}")
@@ -48,32 +54,32 @@ def main():
     # Example 2: List only burst workers
     print("\n\n2. Listing burst workers only:")
     print("-" * 80)
-    try:
-        burst_workers = manager.list_workers(type_filter="burst")
-        print(f"Burst workers: {len(burst_workers)}")
-
-        for worker in burst_workers:
-            print(f"\nBurst Worker: {worker['name']}")
-            print(f"  Status: {worker['status']}")
-            if 'ttl_expires' in worker:
-                print(f"  TTL Expires: {worker['ttl_expires']}")
-
-    except WorkerManagerError as e:
-        print(f"Error listing burst workers: {e}")
+    burst_workers = [w for w in all_workers if w['type'] == 'burst']
+    print(f"Burst workers: {len(burst_workers)}")
+
+    # Bind the field lookup once and emit one buffered write per listing
+    # instead of dict lookups plus a print() per line
+    get_name_status = operator.itemgetter('name', 'status')
+
+    blocks = []
+    for worker in burst_workers:
+        name, status = get_name_status(worker)
+        block = f"\nBurst Worker: {name}\n  Status: {status}\n"
+        if 'ttl_expires' in worker:
+            block += f"  TTL Expires: {worker['ttl_expires']}\n"
+        blocks.append(block)
+    sys.stdout.write("".join(blocks))
 
     # Example 3: List only permanent workers
     print("\n\n3. Listing permanent workers only:")
     print("-" * 80)
-    try:
-        permanent_workers = manager.list_workers(type_filter="permanent")
-        print(f"Permanent workers: {len(permanent_workers)}")
-
-        for worker in permanent_workers:
-            print(f"\nPermanent Worker: {worker['name']}")
-            print(f"  Status: {worker['status']}")
+    permanent_workers = [w for w in all_workers if w['type'] == 'permanent']
+    print(f"Permanent workers: {len(permanent_workers)}")
 
-    except WorkerManagerError as e:
-        print(f"Error listing permanent workers: {e}")
+    sys.stdout.write("".join(
+        f"\nPermanent Worker: {name}\n  Status: {status}\n"
+        for name, status in map(get_name_status, permanent_workers)
+    ))
 
     # Example 4: Provision burst workers
     print("\n\n4. Provisioning burst workers:")
@@ -100,8 +106,7 @@ def main():
     print("\n\n5. Getting worker details:")
     print("-" * 80)
     try:
-        # Get details for the first worker
-        all_workers = manager.list_workers()
+        # Get details for the first worker (reusing the list from example 1)
         if all_workers:
             worker_id = all_workers[0]['name']
             details = manager.get_worker_details(worker_id)
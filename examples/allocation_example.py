@@ -9,9 +9,10 @@ Demonstrates:
 - Releasing resources
 """
 
+import argparse
+import asyncio
 import sys
 import os
-import time
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -29,15 +30,19 @@ def print_section(title):
 def print_capacity(manager):
     """Print current capacity"""
     capacity = manager.get_capacity()
-    print("Cluster Capacity:")
-    print(f"  CPU: {capacity['allocated_cpu']}/{capacity['total_cpu']} "
-          f"({capacity['available_cpu']} available)")
-    print(f"  Memory: {capacity['allocated_memory']}/{capacity['total_memory']} MB "
-          f"({capacity['available_memory']} MB available)")
-    print(f"  Workers: {capacity['allocated_workers']}/{capacity['total_workers']} "
-          f"({capacity['available_workers']} available)")
-    print(f"  Active allocations: {capacity['active_allocations']}")
-    print(f"  Running MCP servers: {', '.join(capacity['running_mcp_servers']) or 'none'}")
+    # Build the report once and write it in a single call instead of one
+    # print()/stdout lock acquisition per line
+    sys.stdout.write(
+        "Cluster Capacity:\n"
+        f"  CPU: {capacity['allocated_cpu']}/{capacity['total_cpu']} "
+        f"({capacity['available_cpu']} available)\n"
+        f"  Memory: {capacity['allocated_memory']}/{capacity['total_memory']} MB "
+        f"({capacity['available_memory']} MB available)\n"
+        f"  Workers: {capacity['allocated_workers']}/{capacity['total_workers']} "
+        f"({capacity['available_workers']} available)\n"
+        f"  Active allocations: {capacity['active_allocations']}\n"
+        f"  Running MCP servers: {', '.join(capacity['running_mcp_servers']) or 'none'}\n"
+    )
 
 
 def example_basic_allocation():
@@ -215,7 +220,7 @@ def example_capacity_checking():
         manager.release_resources(alloc2['allocation_id'])
 
 
-def example_allocation_lifecycle():
+async def example_allocation_lifecycle():
     """Full allocation lifecycle example"""
     print_section("Example 4: Allocation Lifecycle")
 
@@ -245,9 +250,10 @@ def example_allocation_lifecycle():
     print(f"  TTL: {details['ttl_seconds']}s")
     print(f"  Expired: {details['is_expired']}")
 
-    # Wait a bit
+    # Wait a bit without blocking the loop, so the other TTL demo can
+    # make progress in parallel under --auto
     print("\nWaiting 3 seconds...")
-    time.sleep(3)
+    await asyncio.sleep(3)
 
     # Check age
     details = manager.get_allocation(allocation_id)
@@ -265,7 +271,7 @@ def example_allocation_lifecycle():
     print(f"Duration: {result['duration_seconds']:.1f}s")
 
 
-def example_expiry_cleanup():
+async def example_expiry_cleanup():
     """TTL expiry and cleanup example"""
     print_section("Example 5: TTL Expiry and Cleanup")
 
@@ -289,9 +295,14 @@ def example_expiry_cleanup():
     print(f"  State: {details['state']}")
     print(f"  Expired: {details['is_expired']}")
 
-    # Wait for expiry
-    print("\nWaiting 3 seconds for expiry...")
-    time.sleep(3)
+    # Wait for the exact expiry instant instead of sleeping a fixed 3s;
+    # the blocking watch runs in a worker thread so the loop stays free
+    print("\nWatching allocation until it expires...")
+    events = await asyncio.to_thread(
+        lambda: list(manager.watch_expiry(allocation_id, timeout=5))
+    )
+    for event in events:
+        print(f"Event: {event['type']} (state: {event['state']})")
 
     # Check after expiry
     details = manager.get_allocation(allocation_id)
@@ -312,6 +323,22 @@ def example_expiry_cleanup():
 
 def main():
     """Run all examples"""
+    parser = argparse.ArgumentParser(description="Resource Allocation Manager examples")
+    parser.add_argument(
+        "example",
+        nargs="?",
+        type=int,
+        help="Run a single example by number (1-5)"
+    )
+    parser.add_argument(
+        "--auto",
+        action="store_true",
+        # Non-interactive runs (CI, piped stdin) shouldn't block on Enter
+        default=not sys.stdin.isatty(),
+        help="Run examples back-to-back without pausing for Enter"
+    )
+    args = parser.parse_args()
+
     examples = [
         ("Basic Allocation", example_basic_allocation),
         ("Multiple Allocations", example_multiple_allocations),
@@ -324,21 +351,38 @@ def main():
     print("  Resource Allocation Manager - Examples")
     print("="*60)
 
-    if len(sys.argv) > 1:
+    def run_example(func):
+        if asyncio.iscoroutinefunction(func):
+            asyncio.run(func())
+        else:
+            func()
+
+    if args.example is not None:
         # Run specific example
-        try:
-            example_num = int(sys.argv[1]) - 1
-            if 0 <= example_num < len(examples):
-                name, func = examples[example_num]
-                func()
-            else:
-                print(f"\nInvalid example number. Choose 1-{len(examples)}")
-        except ValueError:
-            print("\nUsage: python allocation_example.py [example_number]")
+        example_num = args.example - 1
+        if 0 <= example_num < len(examples):
+            name, func = examples[example_num]
+            run_example(func)
+        else:
+            print(f"\nInvalid example number. Choose 1-{len(examples)}")
+    elif args.auto:
+        # Run the synchronous examples back-to-back, then overlap the
+        # TTL-bound demos on one event loop so the total wait is the
+        # longest TTL rather than the sum of them
+        sync_examples = [f for _, f in examples if not asyncio.iscoroutinefunction(f)]
+        async_examples = [f for _, f in examples if asyncio.iscoroutinefunction(f)]
+
+        for func in sync_examples:
+            func()
+
+        async def run_ttl_demos():
+            await asyncio.gather(*(func() for func in async_examples))
+
+        asyncio.run(run_ttl_demos())
     else:
-        # Run all examples
+        # Run all examples interactively
         for i, (name, func) in enumerate(examples, 1):
-            func()
+            run_example(func)
             if i < len(examples):
                 print("\n" + "-"*60)
                 print("Press Enter to continue to next example...")
@@ -3,11 +3,21 @@ Resource Allocation Manager
 Handles resource allocation, tracking, and lifecycle management for cortex jobs.
 """
 
-import uuid
+import heapq
+import json
+import secrets
 import time
-from dataclasses import dataclass, field, asdict
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from bisect import bisect_right
+from collections import defaultdict, deque
+from itertools import accumulate
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Any
 from enum import Enum
 
 
@@ -28,7 +38,25 @@ class Priority(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Plain dict lookup is cheaper than Enum.__call__ (which raises on unknown
+# values) in the request hot path
+_PRIORITY_LOOKUP = {p.value: p for p in Priority}
+
+
+def serialize(payload: Any) -> str:
+    """
+    Serialize a manager payload to JSON.
+
+    Manager responses contain only JSON-native values (enums and datetimes
+    are stringified when the payload is built), so no default= fallback is
+    needed and orjson's C encoder can be used directly when installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload).decode()
+    return json.dumps(payload)
+
+
+@dataclass(slots=True)
 class WorkerSpec:
     """Worker specification"""
     worker_id: str
@@ -39,7 +67,7 @@ class WorkerSpec:
     endpoint: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPServerSpec:
     """MCP Server specification"""
     server_name: str
@@ -48,7 +76,31 @@ class MCPServerSpec:
     port: Optional[int] = None
 
 
-@dataclass
+def _server_summary(spec: MCPServerSpec) -> Dict[str, Any]:
+    """Response-dict form of a shared MCP server spec.
+
+    A dict literal with constant keys is the fastest construction CPython
+    offers (the key strings are interned compile-time constants), so the
+    builders are shared between response paths rather than re-shaped.
+    """
+    return {
+        'name': spec.server_name,
+        'endpoint': spec.endpoint,
+        'status': spec.status
+    }
+
+
+def _worker_summary(worker: WorkerSpec) -> Dict[str, Any]:
+    """Response-dict form of an allocated worker"""
+    return {
+        'worker_id': worker.worker_id,
+        'endpoint': worker.endpoint,
+        'cpu': worker.cpu,
+        'memory': worker.memory
+    }
+
+
+@dataclass(slots=True)
 class ResourceAllocation:
     """Resource allocation record"""
     allocation_id: str
@@ -60,50 +112,113 @@ class ResourceAllocation:
     mcp_servers: List[str]
     workers_requested: Optional[int] = None
 
-    # Allocated resources
-    mcp_server_specs: List[MCPServerSpec] = field(default_factory=list)
+    # Allocated resources. MCP server specs are shared registry objects
+    # resolved by name at read time (see AllocationManager), not copied
+    # per allocation.
     workers_allocated: List[WorkerSpec] = field(default_factory=list)
 
     # Resource usage
     cpu_allocated: float = 0.0
     memory_allocated: int = 0  # MB
 
-    # Timestamps
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    activated_at: Optional[datetime] = None
-    released_at: Optional[datetime] = None
+    # Timestamps, stored as float epoch seconds so expiry and age checks
+    # are plain float comparisons rather than datetime/timedelta object
+    # arithmetic; datetimes are rebuilt lazily for serialization only
+    created_at_ts: float = field(default_factory=time.time)
+    activated_at_ts: Optional[float] = None
+    released_at_ts: Optional[float] = None
     ttl_seconds: int = 3600  # 1 hour default
 
     # Metadata
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def is_expired(self) -> bool:
-        """Check if allocation has exceeded TTL"""
+    # Lazily cached ISO-format strings; each timestamp is set once, so the
+    # formatting cost is paid on first read instead of per response
+    _created_at_iso: Optional[str] = field(default=None, init=False, repr=False)
+    _activated_at_iso: Optional[str] = field(default=None, init=False, repr=False)
+    _released_at_iso: Optional[str] = field(default=None, init=False, repr=False)
+
+    @property
+    def created_at(self) -> datetime:
+        return datetime.utcfromtimestamp(self.created_at_ts)
+
+    @property
+    def activated_at(self) -> Optional[datetime]:
+        return datetime.utcfromtimestamp(self.activated_at_ts) if self.activated_at_ts else None
+
+    @property
+    def released_at(self) -> Optional[datetime]:
+        return datetime.utcfromtimestamp(self.released_at_ts) if self.released_at_ts else None
+
+    def created_at_iso(self) -> str:
+        if self._created_at_iso is None:
+            self._created_at_iso = self.created_at.isoformat()
+        return self._created_at_iso
+
+    def activated_at_iso(self) -> Optional[str]:
+        if self._activated_at_iso is None and self.activated_at_ts:
+            self._activated_at_iso = self.activated_at.isoformat()
+        return self._activated_at_iso
+
+    def released_at_iso(self) -> Optional[str]:
+        if self._released_at_iso is None and self.released_at_ts:
+            self._released_at_iso = self.released_at.isoformat()
+        return self._released_at_iso
+
+    def expiry_ts(self) -> float:
+        """Epoch time at which this allocation's TTL expires"""
+        return (self.activated_at_ts or self.created_at_ts) + self.ttl_seconds
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Check if allocation has exceeded TTL.
+
+        Batch sweeps can pass a single `time.time()` reading via `now`
+        to avoid one clock call per allocation.
+        """
         if self.state in [AllocationState.RELEASED, AllocationState.FAILED]:
             return False
 
-        reference_time = self.activated_at or self.created_at
-        expiry_time = reference_time + timedelta(seconds=self.ttl_seconds)
-        return datetime.utcnow() > expiry_time
+        if now is None:
+            now = time.time()
+        return now > self.expiry_ts()
 
     def age_seconds(self) -> float:
         """Get allocation age in seconds"""
-        return (datetime.utcnow() - self.created_at).total_seconds()
+        return time.time() - self.created_at_ts
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        data = asdict(self)
-        # Convert enums to strings
-        data['state'] = self.state.value
-        data['priority'] = self.priority.value
-        # Convert datetime objects
-        data['created_at'] = self.created_at.isoformat()
-        data['activated_at'] = self.activated_at.isoformat() if self.activated_at else None
-        data['released_at'] = self.released_at.isoformat() if self.released_at else None
-        return data
+        # Hand-built rather than asdict(): asdict recurses and deep-copies
+        # every nested spec, which is the bulk of serialization cost here
+        return {
+            'allocation_id': self.allocation_id,
+            'job_id': self.job_id,
+            'state': self.state.value,
+            'priority': self.priority.value,
+            'mcp_servers': list(self.mcp_servers),
+            'workers_requested': self.workers_requested,
+            'workers_allocated': [
+                {
+                    'worker_id': w.worker_id,
+                    'worker_type': w.worker_type,
+                    'cpu': w.cpu,
+                    'memory': w.memory,
+                    'status': w.status,
+                    'endpoint': w.endpoint
+                }
+                for w in self.workers_allocated
+            ],
+            'cpu_allocated': self.cpu_allocated,
+            'memory_allocated': self.memory_allocated,
+            'created_at': self.created_at_iso(),
+            'activated_at': self.activated_at_iso(),
+            'released_at': self.released_at_iso(),
+            'ttl_seconds': self.ttl_seconds,
+            'metadata': dict(self.metadata)
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class ClusterCapacity:
     """Cluster resource capacity"""
     total_cpu: float
@@ -114,8 +229,8 @@ class ClusterCapacity:
     allocated_memory: int = 0
     allocated_workers: int = 0
 
-    running_mcp_servers: List[str] = field(default_factory=list)
-    active_allocations: int = 0
+    # Kept as a set for O(1) membership checks on server start
+    running_mcp_servers: set = field(default_factory=set)
 
     @property
     def available_cpu(self) -> float:
@@ -141,14 +256,18 @@ class ClusterCapacity:
             'available_cpu': self.available_cpu,
             'available_memory': self.available_memory,
             'available_workers': self.available_workers,
-            'running_mcp_servers': self.running_mcp_servers,
-            'active_allocations': self.active_allocations
+            # Sorted snapshot: deterministic JSON and callers can't mutate
+            # the live registry set
+            'running_mcp_servers': sorted(self.running_mcp_servers)
         }
 
 
 class AllocationManager:
     """Manages resource allocations and cluster capacity"""
 
+    # How long (seconds) a list_allocations snapshot may be re-served
+    LIST_CACHE_TTL = 1.0
+
     def __init__(
         self,
         total_cpu: float = 16.0,
@@ -163,17 +282,70 @@ class AllocationManager:
         self.allocations: Dict[str, ResourceAllocation] = {}
         self.mcp_server_registry: Dict[str, MCPServerSpec] = {}
 
-        # Configuration
-        self.worker_cpu = 1.0  # CPU per worker
+        # Active allocations referencing each shared server spec; informs
+        # future idle scale-down decisions
+        self._server_refcounts: Dict[str, int] = defaultdict(int)
+
+        # Secondary indexes so list_allocations can answer filtered queries
+        # from the matching ID sets instead of scanning every allocation
+        self._by_state: Dict[AllocationState, set] = {s: set() for s in AllocationState}
+        self._by_job: Dict[str, set] = defaultdict(set)
+
+        # Cached serialized payloads, invalidated on state/capacity mutation;
+        # hit/miss counters are exposed for observability
+        self._allocation_dict_cache: Dict[str, Dict[str, Any]] = {}
+        self._capacity_dict_cache: Optional[Dict[str, Any]] = None
+        self.dict_cache_hits = 0
+        self.dict_cache_misses = 0
+
+        # Short-lived snapshots for list_allocations, keyed by filter pair:
+        # polling UIs re-ask the same question several times a second, and
+        # any allocation mutation clears the whole map
+        self._list_cache: Dict[tuple, tuple] = {}
+
+        # Min-heap of (expiry_ts, allocation_id) so the cleanup sweep pops
+        # only entries that are actually due; stale entries for released or
+        # re-scheduled allocations are dropped lazily on pop
+        self._expiry_heap: List[tuple] = []
+
+        # Configuration. CPU is tracked internally in integer millicores
+        # (Kubernetes' native unit) so capacity comparisons are exact
+        # integer math rather than float arithmetic with epsilon issues;
+        # worker_cpu keeps the public float-cores view.
+        self.worker_cpu_millicores = 1000  # millicores per worker
+        self.worker_cpu = self.worker_cpu_millicores / 1000  # CPU per worker
         self.worker_memory = 2048  # MB per worker
-        self.mcp_server_ports = list(range(9000, 9100))  # Port pool
-        self.next_port_idx = 0
+        # Free-port pool: popleft hands out a port, append reclaims one on
+        # server tear-down, both O(1); an empty deque means real exhaustion
+        # instead of silently re-issuing in-use ports
+        self._free_ports = deque(range(9000, 9100))
+
+    def _store_allocation(self, allocation: ResourceAllocation) -> None:
+        """Store an allocation and register it in the secondary indexes"""
+        self.allocations[allocation.allocation_id] = allocation
+        self._by_state[allocation.state].add(allocation.allocation_id)
+        self._by_job[allocation.job_id].add(allocation.allocation_id)
+        self._allocation_dict_cache.pop(allocation.allocation_id, None)
+        self._list_cache.clear()
+
+    def _set_state(self, allocation: ResourceAllocation, new_state: AllocationState) -> None:
+        """Change allocation state, keeping the state index in sync"""
+        self._by_state[allocation.state].discard(allocation.allocation_id)
+        allocation.state = new_state
+        self._by_state[new_state].add(allocation.allocation_id)
+        self._allocation_dict_cache.pop(allocation.allocation_id, None)
+        self._list_cache.clear()
 
     def _allocate_port(self) -> int:
         """Allocate next available port"""
-        port = self.mcp_server_ports[self.next_port_idx]
-        self.next_port_idx = (self.next_port_idx + 1) % len(self.mcp_server_ports)
-        return port
+        try:
+            return self._free_ports.popleft()
+        except IndexError:
+            raise RuntimeError("No free MCP server ports available") from None
+
+    def _release_port(self, port: int) -> None:
+        """Return a port to the pool (called when a server is torn down)"""
+        self._free_ports.append(port)
 
     def _start_mcp_server(self, server_name: str) -> MCPServerSpec:
         """Start or reuse MCP server"""
@@ -194,35 +366,49 @@ class AllocationManager:
         self.mcp_server_registry[server_name] = spec
 
         # Add to capacity tracking
-        if server_name not in self.capacity.running_mcp_servers:
-            self.capacity.running_mcp_servers.append(server_name)
+        self.capacity.running_mcp_servers.add(server_name)
 
         return spec
 
     def _provision_workers(self, count: int, job_id: str) -> List[WorkerSpec]:
         """Provision workers for job"""
-        workers = []
-        for i in range(count):
-            worker_id = f"worker-{job_id}-{i:03d}"
-            worker = WorkerSpec(
-                worker_id=worker_id,
+        # Note: WorkerSpec objects are deliberately not pooled/reused across
+        # allocations — released allocations keep referencing their specs
+        # (with status "destroying") for get_allocation history, so recycling
+        # an object would silently rewrite old records.
+        # Hoist loop invariants into locals: fast LOAD_FAST lookups in the
+        # comprehension instead of attribute/global loads per worker
+        base_port = 8000 + len(self.allocations) * 10
+        id_prefix = f"worker-{job_id}-"
+        spec_cls = WorkerSpec
+        cpu = self.worker_cpu
+        memory = self.worker_memory
+        return [
+            spec_cls(
+                worker_id=f"{id_prefix}{i:03d}",
                 worker_type="cortex-worker",
-                cpu=self.worker_cpu,
-                memory=self.worker_memory,
+                cpu=cpu,
+                memory=memory,
                 status="active",
-                endpoint=f"http://localhost:{8000 + len(self.allocations) * 10 + i}"
+                endpoint=f"http://localhost:{base_port + i}"
             )
-            workers.append(worker)
-        return workers
+            for i in range(count)
+        ]
 
     def _check_capacity(self, workers_count: int) -> tuple[bool, Optional[str]]:
         """Check if resources are available"""
         if workers_count > self.capacity.available_workers:
             return False, f"Insufficient workers: requested {workers_count}, available {self.capacity.available_workers}"
 
-        cpu_needed = workers_count * self.worker_cpu
-        if cpu_needed > self.capacity.available_cpu:
-            return False, f"Insufficient CPU: needed {cpu_needed}, available {self.capacity.available_cpu}"
+        # Compare in integer millicores so repeated allocate/release cycles
+        # can't accumulate float rounding error at the capacity boundary
+        cpu_needed_millicores = workers_count * self.worker_cpu_millicores
+        available_millicores = round(self.capacity.available_cpu * 1000)
+        if cpu_needed_millicores > available_millicores:
+            return False, (
+                f"Insufficient CPU: needed {cpu_needed_millicores / 1000}, "
+                f"available {self.capacity.available_cpu}"
+            )
 
         memory_needed = workers_count * self.worker_memory
         if memory_needed > self.capacity.available_memory:
@@ -253,13 +439,13 @@ class AllocationManager:
         Returns:
             Dict with allocation details
         """
-        allocation_id = f"alloc-{uuid.uuid4().hex[:12]}"
+        # token_hex(6) yields exactly the 12 hex chars we need, without
+        # building a full 32-char uuid4 hex string just to slice it
+        allocation_id = f"alloc-{secrets.token_hex(6)}"
+        self._capacity_dict_cache = None
 
-        # Validate priority
-        try:
-            priority_enum = Priority(priority)
-        except ValueError:
-            priority_enum = Priority.NORMAL
+        # Validate priority (unknown values fall back to normal)
+        priority_enum = _PRIORITY_LOOKUP.get(priority, Priority.NORMAL)
 
         # Create allocation
         allocation = ResourceAllocation(
@@ -280,23 +466,23 @@ class AllocationManager:
                 if not can_allocate:
                     allocation.state = AllocationState.FAILED
                     allocation.metadata['error'] = error_msg
-                    self.allocations[allocation_id] = allocation
+                    self._store_allocation(allocation)
                     return {
                         'allocation_id': allocation_id,
                         'status': 'failed',
                         'error': error_msg
                     }
 
-            # Start MCP servers
-            for server_name in mcp_servers:
-                server_spec = self._start_mcp_server(server_name)
-                allocation.mcp_server_specs.append(server_spec)
+            # Start MCP servers; the shared registry specs are referenced
+            # by name from the allocation rather than listed per allocation
+            server_specs = [self._start_mcp_server(name) for name in mcp_servers]
 
             # Provision workers if requested
             if workers and workers > 0:
                 worker_specs = self._provision_workers(workers, job_id)
                 allocation.workers_allocated = worker_specs
-                allocation.cpu_allocated = workers * self.worker_cpu
+                # Derive the float-cores figure from exact millicore math
+                allocation.cpu_allocated = workers * self.worker_cpu_millicores / 1000
                 allocation.memory_allocated = workers * self.worker_memory
 
                 # Update capacity
@@ -305,53 +491,80 @@ class AllocationManager:
                 self.capacity.allocated_memory += allocation.memory_allocated
 
             # Activate allocation
+            for server_name in mcp_servers:
+                self._server_refcounts[server_name] += 1
             allocation.state = AllocationState.ACTIVE
-            allocation.activated_at = datetime.utcnow()
-            self.capacity.active_allocations += 1
+            allocation.activated_at_ts = time.time()
+            heapq.heappush(self._expiry_heap, (allocation.expiry_ts(), allocation_id))
 
             # Store allocation
-            self.allocations[allocation_id] = allocation
+            self._store_allocation(allocation)
 
             return {
                 'allocation_id': allocation_id,
                 'status': 'active',
                 'job_id': job_id,
-                'mcp_servers': [
-                    {
-                        'name': spec.server_name,
-                        'endpoint': spec.endpoint,
-                        'status': spec.status
-                    }
-                    for spec in allocation.mcp_server_specs
-                ],
-                'workers_allocated': [
-                    {
-                        'worker_id': w.worker_id,
-                        'endpoint': w.endpoint,
-                        'cpu': w.cpu,
-                        'memory': w.memory
-                    }
-                    for w in allocation.workers_allocated
-                ],
+                'mcp_servers': [_server_summary(spec) for spec in server_specs],
+                'workers_allocated': [_worker_summary(w) for w in allocation.workers_allocated],
                 'resources': {
                     'cpu': allocation.cpu_allocated,
                     'memory': allocation.memory_allocated,
                     'workers': len(allocation.workers_allocated)
                 },
                 'ttl_seconds': ttl_seconds,
-                'created_at': allocation.created_at.isoformat()
+                'created_at': allocation.created_at_iso()
             }
 
         except Exception as e:
             allocation.state = AllocationState.FAILED
             allocation.metadata['error'] = str(e)
-            self.allocations[allocation_id] = allocation
+            self._store_allocation(allocation)
             return {
                 'allocation_id': allocation_id,
                 'status': 'failed',
                 'error': str(e)
             }
 
+    def request_resources_bulk(self, specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Admit a batch of resource requests in one capacity pass.
+
+        Instead of each request running the scalar capacity check (and
+        formatting a rejection) in turn, the cumulative worker demand is
+        computed once and the longest admissible prefix is found with a
+        single bisect. Requests in the prefix are allocated normally; the
+        rest are rejected up front without creating allocation records.
+
+        Args:
+            specs: List of dicts of request_resources keyword arguments
+
+        Returns:
+            List of per-request result dicts, in input order
+        """
+        counts = [int(spec.get('workers') or 0) for spec in specs]
+        cumulative = list(accumulate(counts))
+
+        # Workers admissible under each resource dimension (millicore math
+        # keeps the CPU bound exact, matching _check_capacity)
+        admissible = min(
+            self.capacity.available_workers,
+            round(self.capacity.available_cpu * 1000) // self.worker_cpu_millicores,
+            self.capacity.available_memory // self.worker_memory
+        )
+        fits = bisect_right(cumulative, admissible)
+
+        results = []
+        for i, spec in enumerate(specs):
+            if i < fits:
+                results.append(self.request_resources(**spec))
+            else:
+                results.append({
+                    'job_id': spec.get('job_id'),
+                    'status': 'failed',
+                    'error': 'Insufficient capacity for batch admission'
+                })
+        return results
+
     def release_resources(self, allocation_id: str) -> Dict[str, Any]:
         """
         Release resources for an allocation.
@@ -362,23 +575,26 @@ class AllocationManager:
         Returns:
             Dict with release status
         """
-        if allocation_id not in self.allocations:
+        # Single .get() so the key is hashed once instead of membership
+        # check plus indexing
+        allocation = self.allocations.get(allocation_id)
+        if allocation is None:
             return {
                 'status': 'error',
                 'error': f'Allocation {allocation_id} not found'
             }
 
-        allocation = self.allocations[allocation_id]
+        self._capacity_dict_cache = None
 
         if allocation.state in [AllocationState.RELEASED, AllocationState.RELEASING]:
             return {
                 'status': 'already_released',
                 'allocation_id': allocation_id,
-                'released_at': allocation.released_at.isoformat() if allocation.released_at else None
+                'released_at': allocation.released_at_iso()
             }
 
         # Mark as releasing
-        allocation.state = AllocationState.RELEASING
+        self._set_state(allocation, AllocationState.RELEASING)
 
         try:
             # Release workers
@@ -392,13 +608,16 @@ class AllocationManager:
             for worker in allocation.workers_allocated:
                 worker.status = "destroying"
 
-            # MCP servers remain running (idle timeout will handle them)
-            # In production, you'd mark them for scale-down after idle period
+            # MCP servers remain running (idle timeout will handle them);
+            # drop this allocation's references so idle scale-down can see
+            # which servers are unreferenced
+            for server_name in allocation.mcp_servers:
+                if self._server_refcounts[server_name] > 0:
+                    self._server_refcounts[server_name] -= 1
 
             # Mark as released
-            allocation.state = AllocationState.RELEASED
-            allocation.released_at = datetime.utcnow()
-            self.capacity.active_allocations -= 1
+            self._set_state(allocation, AllocationState.RELEASED)
+            allocation.released_at_ts = time.time()
 
             return {
                 'status': 'released',
@@ -407,12 +626,12 @@ class AllocationManager:
                 'workers_released': workers_released,
                 'cpu_freed': allocation.cpu_allocated,
                 'memory_freed': allocation.memory_allocated,
-                'released_at': allocation.released_at.isoformat(),
+                'released_at': allocation.released_at_iso(),
                 'duration_seconds': allocation.age_seconds()
             }
 
         except Exception as e:
-            allocation.state = AllocationState.FAILED
+            self._set_state(allocation, AllocationState.FAILED)
             allocation.metadata['release_error'] = str(e)
             return {
                 'status': 'error',
@@ -426,7 +645,14 @@ class AllocationManager:
         Returns:
             Dict with capacity information
         """
-        return self.capacity.to_dict()
+        if self._capacity_dict_cache is None:
+            self._capacity_dict_cache = self.capacity.to_dict()
+        # Top-level copy so callers can't mutate the cached snapshot
+        data = dict(self._capacity_dict_cache)
+        # Derived from the state index rather than a separately maintained
+        # counter, so it can never drift from the allocation table
+        data['active_allocations'] = len(self._by_state[AllocationState.ACTIVE])
+        return data
 
     def get_allocation(self, allocation_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -438,49 +664,138 @@ class AllocationManager:
         Returns:
             Dict with allocation details or None if not found
         """
-        if allocation_id not in self.allocations:
+        allocation = self.allocations.get(allocation_id)
+        if allocation is None:
             return None
 
-        allocation = self.allocations[allocation_id]
+        # The nested spec dicts are expensive to rebuild and only change on
+        # state transitions, so they're cached; the per-call volatile fields
+        # (age_seconds, is_expired) are overlaid on a shallow copy
+        cached = self._allocation_dict_cache.get(allocation_id)
+        if cached is None:
+            self.dict_cache_misses += 1
+            cached = {
+                'allocation_id': allocation.allocation_id,
+                'job_id': allocation.job_id,
+                'state': allocation.state.value,
+                'priority': allocation.priority.value,
+                'resources': {
+                    'cpu_allocated': allocation.cpu_allocated,
+                    'memory_allocated': allocation.memory_allocated,
+                    'workers': len(allocation.workers_allocated)
+                },
+                'mcp_servers': [
+                    _server_summary(spec)
+                    for spec in map(self.mcp_server_registry.get, allocation.mcp_servers)
+                    if spec is not None
+                ],
+                'workers': [
+                    {
+                        'worker_id': w.worker_id,
+                        'endpoint': w.endpoint,
+                        'status': w.status,
+                        'cpu': w.cpu,
+                        'memory': w.memory
+                    }
+                    for w in allocation.workers_allocated
+                ],
+                'timestamps': {
+                    'created_at': allocation.created_at_iso(),
+                    'activated_at': allocation.activated_at_iso(),
+                    'released_at': allocation.released_at_iso()
+                },
+                'ttl_seconds': allocation.ttl_seconds,
+                'metadata': allocation.metadata
+            }
+            self._allocation_dict_cache[allocation_id] = cached
+        else:
+            self.dict_cache_hits += 1
+
+        data = dict(cached)
+        data['timestamps'] = {**cached['timestamps'], 'age_seconds': allocation.age_seconds()}
+        data['is_expired'] = allocation.is_expired()
+        return data
 
-        return {
-            'allocation_id': allocation.allocation_id,
-            'job_id': allocation.job_id,
-            'state': allocation.state.value,
-            'priority': allocation.priority.value,
-            'resources': {
-                'cpu_allocated': allocation.cpu_allocated,
-                'memory_allocated': allocation.memory_allocated,
-                'workers': len(allocation.workers_allocated)
-            },
-            'mcp_servers': [
-                {
-                    'name': spec.server_name,
-                    'endpoint': spec.endpoint,
-                    'status': spec.status
+    def watch_expiry(
+        self,
+        allocation_id: str,
+        timeout: Optional[float] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Watch an allocation until it expires, is released, or timeout passes.
+
+        Instead of callers polling get_allocation() on a fixed sleep
+        interval, this sleeps until the allocation's exact expiry deadline
+        and yields a single terminal event, so watchers wake at the moment
+        of the transition rather than on sleep slack.
+
+        Args:
+            allocation_id: Allocation identifier
+            timeout: Maximum time to watch in seconds (None = until expiry)
+
+        Yields:
+            Event dict with 'type' ('expired', 'released', or 'timeout'),
+            'allocation_id', and current 'state'. Yields nothing if the
+            allocation does not exist.
+        """
+        allocation = self.allocations.get(allocation_id)
+        if allocation is None:
+            return
+
+        watch_deadline = time.monotonic() + timeout if timeout is not None else None
+
+        while True:
+            if allocation.state in [AllocationState.RELEASED, AllocationState.FAILED]:
+                yield {
+                    'type': 'released',
+                    'allocation_id': allocation_id,
+                    'state': allocation.state.value
                 }
-                for spec in allocation.mcp_server_specs
-            ],
-            'workers': [
-                {
-                    'worker_id': w.worker_id,
-                    'endpoint': w.endpoint,
-                    'status': w.status,
-                    'cpu': w.cpu,
-                    'memory': w.memory
+                return
+
+            if allocation.is_expired():
+                yield {
+                    'type': 'expired',
+                    'allocation_id': allocation_id,
+                    'state': allocation.state.value
                 }
-                for w in allocation.workers_allocated
-            ],
-            'timestamps': {
-                'created_at': allocation.created_at.isoformat(),
-                'activated_at': allocation.activated_at.isoformat() if allocation.activated_at else None,
-                'released_at': allocation.released_at.isoformat() if allocation.released_at else None,
-                'age_seconds': allocation.age_seconds()
-            },
-            'ttl_seconds': allocation.ttl_seconds,
-            'is_expired': allocation.is_expired(),
-            'metadata': allocation.metadata
-        }
+                return
+
+            remaining = allocation.expiry_ts() - time.time()
+
+            if watch_deadline is not None:
+                until_deadline = watch_deadline - time.monotonic()
+                if until_deadline <= 0:
+                    yield {
+                        'type': 'timeout',
+                        'allocation_id': allocation_id,
+                        'state': allocation.state.value
+                    }
+                    return
+                remaining = min(remaining, until_deadline)
+
+            time.sleep(max(remaining, 0))
+
+    def seconds_until_next_expiry(self) -> Optional[float]:
+        """
+        Seconds until the earliest active allocation expires.
+
+        Skims stale heap entries (released allocations, extended TTLs) off
+        the top so the answer reflects a live deadline. Returns None when
+        no active allocation is scheduled to expire.
+        """
+        while self._expiry_heap:
+            expiry_ts, allocation_id = self._expiry_heap[0]
+            allocation = self.allocations.get(allocation_id)
+            if allocation is None or allocation.state != AllocationState.ACTIVE:
+                heapq.heappop(self._expiry_heap)
+                continue
+            current_ts = allocation.expiry_ts()
+            if current_ts > expiry_ts:
+                heapq.heapreplace(self._expiry_heap, (current_ts, allocation_id))
+                continue
+            return max(expiry_ts - time.time(), 0.0)
+        return None
 
     def cleanup_expired_allocations(self) -> List[str]:
         """
@@ -489,37 +804,58 @@ class AllocationManager:
         Returns:
             List of cleaned up allocation IDs
         """
+        now = time.time()
         expired = []
-        for allocation_id, allocation in list(self.allocations.items()):
-            if allocation.is_expired() and allocation.state == AllocationState.ACTIVE:
-                self.release_resources(allocation_id)
-                expired.append(allocation_id)
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, allocation_id = heapq.heappop(self._expiry_heap)
+            allocation = self.allocations.get(allocation_id)
+            if allocation is None or allocation.state != AllocationState.ACTIVE:
+                continue  # stale entry for a released/failed allocation
+            if allocation.expiry_ts() > now:
+                # TTL was extended after the push; re-queue at the new deadline
+                heapq.heappush(self._expiry_heap, (allocation.expiry_ts(), allocation_id))
+                continue
+            self.release_resources(allocation_id)
+            expired.append(allocation_id)
         return expired
 
-    def list_allocations(
+    def iter_allocations(
         self,
         state: Optional[str] = None,
         job_id: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> Iterator[Dict[str, Any]]:
         """
-        List allocations with optional filtering.
+        Iterate allocation summaries with optional filtering.
+
+        Summaries are yielded lazily, so paginating callers (e.g. via
+        itertools.islice) only pay for the rows they consume.
 
         Args:
             state: Filter by allocation state
             job_id: Filter by job ID
 
-        Returns:
-            List of allocation summaries
+        Yields:
+            Allocation summary dicts
         """
-        results = []
-        for allocation_id, allocation in self.allocations.items():
-            # Apply filters
-            if state and allocation.state.value != state:
-                continue
-            if job_id and allocation.job_id != job_id:
-                continue
-
-            results.append({
+        # Resolve filters against the secondary indexes so a query touches
+        # only the matching IDs rather than every allocation
+        candidate_ids = None
+        if state:
+            try:
+                candidate_ids = self._by_state[AllocationState(state)]
+            except ValueError:
+                return  # Unknown state matches nothing
+        if job_id:
+            job_ids = self._by_job.get(job_id, set())
+            candidate_ids = job_ids if candidate_ids is None else candidate_ids & job_ids
+
+        if candidate_ids is None:
+            candidates = self.allocations.items()
+        else:
+            candidates = ((aid, self.allocations[aid]) for aid in candidate_ids)
+
+        for allocation_id, allocation in candidates:
+            yield {
                 'allocation_id': allocation_id,
                 'job_id': allocation.job_id,
                 'state': allocation.state.value,
@@ -527,6 +863,32 @@ class AllocationManager:
                 'workers': len(allocation.workers_allocated),
                 'age_seconds': allocation.age_seconds(),
                 'is_expired': allocation.is_expired()
-            })
+            }
 
-        return results
+    def list_allocations(
+        self,
+        state: Optional[str] = None,
+        job_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List allocations with optional filtering.
+
+        Args:
+            state: Filter by allocation state
+            job_id: Filter by job ID
+
+        Returns:
+            List of allocation summaries
+        """
+        # Serve repeat polls from a 1-second snapshot: the TTL keeps the
+        # volatile age_seconds field roughly fresh while mutations clear
+        # the cache outright
+        key = (state, job_id)
+        now = time.monotonic()
+        cached = self._list_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return list(cached[1])
+
+        rows = list(self.iter_allocations(state=state, job_id=job_id))
+        self._list_cache[key] = (now + self.LIST_CACHE_TTL, rows)
+        return list(rows)
@@ -5,28 +5,240 @@ This module provides tools for managing the lifecycle of MCP (Model Context Prot
 servers running on Kubernetes, including starting, stopping, scaling, and monitoring.
 """
 
+import re
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Any
 from datetime import datetime
-from kubernetes import client, config
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# One DFA pass covers both the character-set rule and the no-leading/
+# trailing-hyphen rule that were previously separate Python-level checks
+_NAME_RE = re.compile(r'[a-z0-9]([a-z0-9-]*[a-z0-9])?$', re.IGNORECASE)
+
+
+def _validate_mcp_name(name: str) -> str:
+    """
+    Validate an MCP server name.
+
+    Names are low-cardinality and immutable, so the regex check is
+    memoised; repeated lifecycle calls for the same server skip it
+    entirely. The type/emptiness guard stays outside the cache so
+    unhashable input still raises ValueError, not the lru_cache's
+    TypeError.
+
+    Args:
+        name: MCP server name
+
+    Returns:
+        Validated (lowercased) name
+
+    Raises:
+        ValueError: If name is invalid
+    """
+    if not name or not isinstance(name, str):
+        raise ValueError("MCP server name must be a non-empty string")
+
+    return _validate_known_str_name(name)
+
+
+@lru_cache(maxsize=1024)
+def _validate_known_str_name(name: str) -> str:
+    """Memoised regex check for a known-str, non-empty name."""
+    if not _NAME_RE.fullmatch(name):
+        raise ValueError(
+            f"Invalid MCP server name: {name}. Must contain only alphanumeric "
+            f"characters and hyphens and cannot start or end with a hyphen"
+        )
+
+    return name.lower()
+
+
+class _ResourceCache:
+    """
+    Informer-style in-memory cache of one namespaced resource type.
+
+    Seeds itself with an initial LIST, then keeps a name-keyed dict in
+    sync from a background watch stream, so reads hit RAM instead of
+    issuing apiserver round-trips.
+    """
+
+    def __init__(self, list_func, namespace: str, label_selector: Optional[str] = None):
+        self._list_func = list_func
+        self._list_kwargs: Dict[str, Any] = {"namespace": namespace}
+        if label_selector:
+            self._list_kwargs["label_selector"] = label_selector
+        self._items: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._resource_version: Optional[str] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        """Seed the cache and start the background watch thread."""
+        if self._thread is not None:
+            return
+        self._seed()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background watch thread."""
+        self._stopped.set()
+
+    def get(self, name: str) -> Optional[Any]:
+        """Return the cached object for name, or None on miss."""
+        with self._lock:
+            return self._items.get(name)
+
+    def values(self) -> List[Any]:
+        """Return a snapshot of all cached objects."""
+        with self._lock:
+            return list(self._items.values())
+
+    def _seed(self) -> None:
+        initial = self._list_func(**self._list_kwargs)
+        with self._lock:
+            self._items = {obj.metadata.name: obj for obj in initial.items}
+        self._resource_version = initial.metadata.resource_version
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                stream = watch.Watch().stream(
+                    self._list_func,
+                    resource_version=self._resource_version,
+                    timeout_seconds=300,
+                    **self._list_kwargs
+                )
+                for event in stream:
+                    obj = event['object']
+                    with self._lock:
+                        if event['type'] == 'DELETED':
+                            self._items.pop(obj.metadata.name, None)
+                        else:
+                            self._items[obj.metadata.name] = obj
+                    self._resource_version = obj.metadata.resource_version
+                    if self._stopped.is_set():
+                        return
+            except ApiException as e:
+                if e.status == 410:
+                    # resourceVersion too old; re-list and resume from there
+                    try:
+                        self._seed()
+                    except Exception:
+                        time.sleep(1)
+                else:
+                    time.sleep(1)
+            except Exception:
+                time.sleep(1)
+
+
+class _FastApiClient(client.ApiClient):
+    """
+    ApiClient that parses response bodies with orjson when available.
+
+    stdlib json parsing dominates CPU on large list responses; orjson cuts
+    the parse roughly 3x. Falls back to the stock path when orjson is not
+    installed or the body is not plain JSON.
+    """
+
+    def deserialize(self, response, response_type):
+        if orjson is None or response_type == "file":
+            return super().deserialize(response, response_type)
+        try:
+            data = orjson.loads(response.data)
+        except orjson.JSONDecodeError:
+            return super().deserialize(response, response_type)
+        return self._ApiClient__deserialize(data, response_type)
+
 
 class MCPLifecycleManager:
     """Manages lifecycle operations for MCP servers running on Kubernetes."""
 
-    def __init__(self, namespace: str = "default", kubeconfig_path: Optional[str] = None):
+    MCP_LABEL_SELECTOR = "app.kubernetes.io/component=mcp-server"
+
+    # How long (seconds) to remember that a server has no companion Service
+    _NO_SVC_TTL = 30.0
+
+    def __init__(
+        self,
+        namespace: str = "default",
+        kubeconfig_path: Optional[str] = None,
+        watch_cache: bool = False
+    ):
         """
         Initialize the MCP Lifecycle Manager.
 
         Args:
             namespace: Kubernetes namespace where MCP servers are deployed
             kubeconfig_path: Path to kubeconfig file (optional, uses default if not provided)
+            watch_cache: Keep deployments and services in watch-fed caches
+                so status reads are served from memory
         """
         self.namespace = namespace
         self._load_kubernetes_config(kubeconfig_path)
-        self.apps_v1 = client.AppsV1Api()
-        self.core_v1 = client.CoreV1Api()
+
+        # One shared ApiClient with a widened urllib3 pool: the default
+        # maxsize (4) forces TCP+TLS renegotiation under concurrent status
+        # fan-outs, and sharing the client keeps apps/core traffic on the
+        # same keep-alive connections
+        configuration = client.Configuration.get_default_copy()
+        configuration.connection_pool_maxsize = 32
+        self.api_client = _FastApiClient(configuration=configuration)
+        self.apps_v1 = client.AppsV1Api(api_client=self.api_client)
+        self.core_v1 = client.CoreV1Api(api_client=self.api_client)
+        self._dep_cache: Optional[_ResourceCache] = None
+        self._svc_cache: Optional[_ResourceCache] = None
+        # Negative lookup cache for _get_service_endpoints: name -> time of
+        # the last 404, so missing services aren't re-fetched every listing
+        self._no_svc: Dict[str, float] = {}
+        if watch_cache:
+            self.enable_watch_cache()
+
+    def enable_watch_cache(self) -> None:
+        """
+        Start informer-style caches for MCP deployments and services.
+
+        After this, list and status reads are answered from memory kept
+        current by watch events; direct API reads remain as a fallback
+        for names the caches have not seen.
+        """
+        if self._dep_cache is None:
+            self._dep_cache = _ResourceCache(
+                self.apps_v1.list_namespaced_deployment,
+                self.namespace,
+                label_selector=self.MCP_LABEL_SELECTOR
+            )
+            self._dep_cache.start()
+        if self._svc_cache is None:
+            self._svc_cache = _ResourceCache(
+                self.core_v1.list_namespaced_service,
+                self.namespace
+            )
+            self._svc_cache.start()
+
+    def close(self) -> None:
+        """
+        Shut down the manager: stop any watch caches and release the
+        shared ApiClient's connection pool.
+        """
+        if self._dep_cache is not None:
+            self._dep_cache.stop()
+            self._dep_cache = None
+        if self._svc_cache is not None:
+            self._svc_cache.stop()
+            self._svc_cache = None
+        self.api_client.close()
 
     def _load_kubernetes_config(self, kubeconfig_path: Optional[str] = None):
         """Load Kubernetes configuration from cluster or kubeconfig file."""
@@ -40,30 +252,10 @@ class MCPLifecycleManager:
             else:
                 config.load_kube_config()
 
-    def _validate_mcp_name(self, name: str) -> str:
-        """
-        Validate MCP server name.
-
-        Args:
-            name: MCP server name
-
-        Returns:
-            Validated name
-
-        Raises:
-            ValueError: If name is invalid
-        """
-        if not name or not isinstance(name, str):
-            raise ValueError("MCP server name must be a non-empty string")
-
-        # Kubernetes name validation (lowercase alphanumeric with hyphens)
-        if not all(c.isalnum() or c == '-' for c in name):
-            raise ValueError(f"Invalid MCP server name: {name}. Must contain only alphanumeric characters and hyphens")
-
-        if name.startswith('-') or name.endswith('-'):
-            raise ValueError(f"Invalid MCP server name: {name}. Cannot start or end with hyphen")
-
-        return name.lower()
+    @staticmethod
+    def _validate_mcp_name(name: str) -> str:
+        """Validate MCP server name (memoised module-level check)."""
+        return _validate_mcp_name(name)
 
     def _validate_replicas(self, replicas: int) -> int:
         """
@@ -100,6 +292,11 @@ class MCPLifecycleManager:
             ValueError: If deployment not found
             ApiException: If Kubernetes API error occurs
         """
+        if self._dep_cache is not None:
+            deployment = self._dep_cache.get(name)
+            if deployment is not None:
+                return deployment
+
         try:
             deployment = self.apps_v1.read_namespaced_deployment(
                 name=name,
@@ -121,32 +318,53 @@ class MCPLifecycleManager:
         Returns:
             List of endpoint URLs
         """
+        if self._svc_cache is not None:
+            service = self._svc_cache.get(name)
+            if service is not None:
+                return self._endpoints_from_service(service)
+
+        # Negative cache: servers without a companion Service would
+        # otherwise pay a fresh 404 round-trip on every status listing
+        if time.monotonic() - self._no_svc.get(name, -self._NO_SVC_TTL) < self._NO_SVC_TTL:
+            return []
+
         try:
             service = self.core_v1.read_namespaced_service(
                 name=name,
                 namespace=self.namespace
             )
-
-            endpoints = []
-            if service.spec.type == "LoadBalancer":
-                if service.status.load_balancer.ingress:
-                    for ingress in service.status.load_balancer.ingress:
-                        ip = ingress.ip or ingress.hostname
-                        for port in service.spec.ports:
-                            endpoints.append(f"http://{ip}:{port.port}")
-            elif service.spec.type == "NodePort":
-                for port in service.spec.ports:
-                    endpoints.append(f"nodePort://*:{port.node_port}")
-            elif service.spec.type == "ClusterIP":
-                cluster_ip = service.spec.cluster_ip
-                for port in service.spec.ports:
-                    endpoints.append(f"http://{cluster_ip}:{port.port}")
-
-            return endpoints
-        except ApiException:
-            # Service might not exist
+        except ApiException as e:
+            if e.status == 404:
+                # Remember the miss for a while; the TTL lets a service
+                # created later be picked up
+                self._no_svc[name] = time.monotonic()
             return []
 
+        self._no_svc.pop(name, None)
+        return self._endpoints_from_service(service)
+
+    @staticmethod
+    def _endpoints_from_service(service: client.V1Service) -> List[str]:
+        """Build endpoint URLs from a service object."""
+        # Hoist the spec lookups and build each list in one comprehension
+        # rather than append-per-port inside nested loops
+        svc_type = service.spec.type
+        ports = service.spec.ports
+
+        if svc_type == "LoadBalancer":
+            return [
+                f"http://{ingress.ip or ingress.hostname}:{port.port}"
+                for ingress in (service.status.load_balancer.ingress or [])
+                for port in ports
+            ]
+        if svc_type == "NodePort":
+            return [f"nodePort://*:{port.node_port}" for port in ports]
+        if svc_type == "ClusterIP":
+            cluster_ip = service.spec.cluster_ip
+            return [f"http://{cluster_ip}:{port.port}" for port in ports]
+
+        return []
+
     def _get_deployment_status(self, deployment: client.V1Deployment) -> str:
         """
         Determine deployment status.
@@ -162,14 +380,15 @@ class MCPLifecycleManager:
         ready_replicas = status.ready_replicas or 0
         replicas = status.replicas or 0
 
+        # Early returns rather than an elif chain: the hot "running" path
+        # (steady-state listings) exits after two comparisons instead of four
         if spec_replicas == 0:
             return "stopped"
-        elif ready_replicas == spec_replicas:
+        if ready_replicas == spec_replicas:
             return "running"
-        elif replicas != spec_replicas or ready_replicas != spec_replicas:
+        if replicas != spec_replicas or ready_replicas != spec_replicas:
             return "scaling"
-        else:
-            return "pending"
+        return "pending"
 
     def _wait_for_ready(self, name: str, timeout: int = 300) -> bool:
         """
@@ -182,29 +401,66 @@ class MCPLifecycleManager:
         Returns:
             True if ready, False if timeout
         """
-        start_time = time.time()
+        # Watch the deployment instead of polling with GETs every 2s: the
+        # apiserver pushes each status change, so readiness is detected the
+        # moment it happens with no per-poll round-trips
+        deadline = time.monotonic() + timeout
 
-        while time.time() - start_time < timeout:
-            try:
-                deployment = self._get_deployment(name)
-                spec_replicas = deployment.spec.replicas or 0
-                ready_replicas = deployment.status.ready_replicas or 0
+        # When the watch errors out we fall back to polling with exponential
+        # backoff: short starts retry after 100ms instead of a fixed 2s tick
+        retry_delay = 0.1
 
-                if spec_replicas > 0 and ready_replicas == spec_replicas:
-                    return True
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
 
-                time.sleep(2)
+            w = watch.Watch()
+            try:
+                for event in w.stream(
+                    self.apps_v1.list_namespaced_deployment,
+                    namespace=self.namespace,
+                    field_selector=f"metadata.name={name}",
+                    timeout_seconds=max(1, int(remaining))
+                ):
+                    deployment = event['object']
+                    spec_replicas = deployment.spec.replicas or 0
+                    ready_replicas = deployment.status.ready_replicas or 0
+
+                    if spec_replicas > 0 and ready_replicas == spec_replicas:
+                        w.stop()
+                        return True
+
+                    if time.monotonic() >= deadline:
+                        w.stop()
+                        return False
+            except ApiException as e:
+                if e.status == 410:
+                    # resourceVersion expired; restart the stream
+                    continue
+                if e.status not in (500, 502, 503, 504):
+                    # 404/403 and friends will not heal inside this loop;
+                    # surface them instead of spinning until the deadline
+                    raise
+                time.sleep(min(retry_delay, max(deadline - time.monotonic(), 0)))
+                retry_delay = min(retry_delay * 1.5, 2.0)
             except Exception:
-                time.sleep(2)
-
-        return False
-
-    def list_mcp_servers(self, label_selector: str = "app.kubernetes.io/component=mcp-server") -> List[Dict[str, Any]]:
+                # Connection-level blips: retry on the same short backoff
+                time.sleep(min(retry_delay, max(deadline - time.monotonic(), 0)))
+                retry_delay = min(retry_delay * 1.5, 2.0)
+
+    def list_mcp_servers(
+        self,
+        label_selector: str = "app.kubernetes.io/component=mcp-server",
+        field_selector: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
         List all registered MCP servers.
 
         Args:
             label_selector: Kubernetes label selector to filter MCP deployments
+            field_selector: Optional field selector (e.g. "metadata.name=foo")
+                so the apiserver filters objects instead of the client
 
         Returns:
             List of dictionaries containing:
@@ -218,31 +474,119 @@ class MCPLifecycleManager:
             ApiException: If Kubernetes API error occurs
         """
         try:
-            deployments = self.apps_v1.list_namespaced_deployment(
-                namespace=self.namespace,
-                label_selector=label_selector
-            )
+            deployments = list(self._iter_deployments(label_selector, field_selector))
+            if not deployments:
+                return []
+
+            # Endpoint lookups are independent service GETs; fan them out
+            # so list latency is ~1 round-trip instead of one per server
+            names = [deployment.metadata.name for deployment in deployments]
+            with ThreadPoolExecutor(max_workers=min(16, len(names))) as executor:
+                endpoints_map = dict(zip(names, executor.map(self._get_service_endpoints, names)))
+
+            return [
+                self._server_info(deployment, endpoints_map[deployment.metadata.name])
+                for deployment in deployments
+            ]
+        except ApiException as e:
+            raise Exception(f"Failed to list MCP servers: {e.reason}")
 
-            servers = []
-            for deployment in deployments.items:
-                name = deployment.metadata.name
-                status_str = self._get_deployment_status(deployment)
-                spec_replicas = deployment.spec.replicas or 0
-                ready_replicas = deployment.status.ready_replicas or 0
-                endpoints = self._get_service_endpoints(name)
+    def iter_mcp_servers(
+        self,
+        label_selector: str = "app.kubernetes.io/component=mcp-server",
+        field_selector: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream registered MCP servers one at a time.
 
-                servers.append({
-                    "name": name,
-                    "status": status_str,
-                    "replicas": spec_replicas,
-                    "ready_replicas": ready_replicas,
-                    "endpoints": endpoints
-                })
+        Servers are yielded as each paginated LIST response arrives, so
+        memory stays constant no matter how many deployments match.
 
-            return servers
+        Args:
+            label_selector: Kubernetes label selector to filter MCP deployments
+            field_selector: Optional field selector for server-side filtering
 
-        except ApiException as e:
-            raise Exception(f"Failed to list MCP servers: {e.reason}")
+        Yields:
+            Server information dictionaries (same shape as list_mcp_servers)
+
+        Raises:
+            ApiException: If Kubernetes API error occurs
+        """
+        for deployment in self._iter_deployments(label_selector, field_selector):
+            yield self._server_info(deployment)
+
+    def _iter_deployments(
+        self,
+        label_selector: str,
+        field_selector: Optional[str] = None
+    ) -> Iterator[client.V1Deployment]:
+        """Yield matching deployments from the cache or paginated LISTs."""
+        # Serve the default listing straight from the watch cache when it
+        # is enabled; custom selectors still go to the apiserver
+        if (
+            self._dep_cache is not None
+            and label_selector == self.MCP_LABEL_SELECTOR
+            and not field_selector
+        ):
+            yield from self._dep_cache.values()
+            return
+
+        continue_token = None
+        while True:
+            list_kwargs = {
+                "namespace": self.namespace,
+                "label_selector": label_selector,
+                "limit": 500,
+            }
+            if field_selector:
+                list_kwargs["field_selector"] = field_selector
+            if continue_token:
+                # Continuation tokens carry their own resource version
+                list_kwargs["_continue"] = continue_token
+            else:
+                # resource_version="0" lets the apiserver answer from
+                # its in-memory watch cache instead of a quorum read
+                # against etcd
+                list_kwargs["resource_version"] = "0"
+                list_kwargs["resource_version_match"] = "NotOlderThan"
+
+            deployments = self.apps_v1.list_namespaced_deployment(**list_kwargs)
+
+            yield from deployments.items
+
+            continue_token = deployments.metadata._continue
+            if not continue_token:
+                return
+
+    def _patch_replicas(self, name: str, replicas: int) -> client.V1Scale:
+        """
+        Set the replica count through the /scale subresource.
+
+        The patch body carries only the new count, so a mutation is a few
+        hundred bytes instead of the full deployment JSON both ways.
+        """
+        return self.apps_v1.patch_namespaced_deployment_scale(
+            name=name,
+            namespace=self.namespace,
+            body={"spec": {"replicas": replicas}}
+        )
+
+    def _server_info(
+        self,
+        deployment: client.V1Deployment,
+        endpoints: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Build the list_mcp_servers entry for one deployment."""
+        name = deployment.metadata.name
+        if endpoints is None:
+            endpoints = self._get_service_endpoints(name)
+        return {
+            "name": name,
+            "status": self._get_deployment_status(deployment),
+            "replicas": deployment.spec.replicas or 0,
+            "ready_replicas": deployment.status.ready_replicas or 0,
+            "endpoints": endpoints
+        }
 
     def get_mcp_status(self, name: str) -> Dict[str, Any]:
         """
@@ -271,52 +615,7 @@ class MCPLifecycleManager:
 
         try:
             deployment = self._get_deployment(name)
-            status_str = self._get_deployment_status(deployment)
-            endpoints = self._get_service_endpoints(name)
-
-            # Extract status information
-            status = deployment.status
-            spec_replicas = deployment.spec.replicas or 0
-            ready_replicas = status.ready_replicas or 0
-            available_replicas = status.available_replicas or 0
-            updated_replicas = status.updated_replicas or 0
-
-            # Get last activity timestamp
-            last_activity = None
-            if deployment.metadata.annotations:
-                last_activity = deployment.metadata.annotations.get(
-                    "deployment.kubernetes.io/revision-timestamp"
-                )
-
-            if not last_activity and status.conditions:
-                # Use the latest condition timestamp
-                timestamps = [c.last_update_time for c in status.conditions if c.last_update_time]
-                if timestamps:
-                    last_activity = max(timestamps).isoformat()
-
-            # Format conditions
-            conditions = []
-            if status.conditions:
-                for condition in status.conditions:
-                    conditions.append({
-                        "type": condition.type,
-                        "status": condition.status,
-                        "reason": condition.reason,
-                        "message": condition.message,
-                        "last_update": condition.last_update_time.isoformat() if condition.last_update_time else None
-                    })
-
-            return {
-                "name": name,
-                "status": status_str,
-                "replicas": spec_replicas,
-                "ready_replicas": ready_replicas,
-                "available_replicas": available_replicas,
-                "updated_replicas": updated_replicas,
-                "endpoints": endpoints,
-                "last_activity": last_activity,
-                "conditions": conditions
-            }
+            return self._status_from_deployment(deployment)
 
         except ValueError:
             raise
@@ -325,6 +624,93 @@ class MCPLifecycleManager:
                 raise ValueError(f"MCP server '{name}' not found in namespace '{self.namespace}'")
             raise Exception(f"Failed to get MCP server status: {e.reason}")
 
+    def _status_from_deployment(
+        self,
+        deployment: client.V1Deployment,
+        endpoints: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the detailed status dict from a deployment object.
+
+        Mutation paths call this with the deployment they already hold so
+        their responses don't cost another apiserver GET.
+        """
+        name = deployment.metadata.name
+        status_str = self._get_deployment_status(deployment)
+        if endpoints is None:
+            endpoints = self._get_service_endpoints(name)
+
+        # Extract status information
+        status = deployment.status
+        spec_replicas = deployment.spec.replicas or 0
+        ready_replicas = status.ready_replicas or 0
+        available_replicas = status.available_replicas or 0
+        updated_replicas = status.updated_replicas or 0
+
+        # Get last activity timestamp
+        last_activity = None
+        if deployment.metadata.annotations:
+            last_activity = deployment.metadata.annotations.get(
+                "deployment.kubernetes.io/revision-timestamp"
+            )
+
+        # Format conditions, tracking the latest timestamp in the same pass
+        # instead of materialising a list just to run max() over it
+        conditions = []
+        last_ts = None
+        for condition in (status.conditions or ()):
+            ts = condition.last_update_time
+            if ts is not None and (last_ts is None or ts > last_ts):
+                last_ts = ts
+            conditions.append({
+                "type": condition.type,
+                "status": condition.status,
+                "reason": condition.reason,
+                "message": condition.message,
+                "last_update": ts.isoformat() if ts else None
+            })
+
+        if not last_activity and last_ts is not None:
+            last_activity = last_ts.isoformat()
+
+        return {
+            "name": name,
+            "status": status_str,
+            "replicas": spec_replicas,
+            "ready_replicas": ready_replicas,
+            "available_replicas": available_replicas,
+            "updated_replicas": updated_replicas,
+            "endpoints": endpoints,
+            "last_activity": last_activity,
+            "conditions": conditions
+        }
+
+    def get_mcp_statuses(self, names: List[str], max_workers: int = 20) -> List[Dict[str, Any]]:
+        """
+        Get detailed status of several MCP servers concurrently.
+
+        Each status lookup is an independent apiserver round-trip, so the
+        lookups are fanned out over a bounded thread pool instead of being
+        issued sequentially. Wall time collapses from N round-trips to
+        roughly one.
+
+        Args:
+            names: MCP server names to query
+            max_workers: Upper bound on concurrent apiserver requests
+
+        Returns:
+            List of status dictionaries in the same order as names
+
+        Raises:
+            ValueError: If any MCP server is not found
+            ApiException: If a Kubernetes API error occurs
+        """
+        if not names:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(names))) as executor:
+            return list(executor.map(self.get_mcp_status, names))
+
     def start_mcp(self, name: str, wait_ready: bool = True, timeout: int = 300) -> Dict[str, Any]:
         """
         Start an MCP server by scaling from 0 to 1 replica.
@@ -349,16 +735,13 @@ class MCPLifecycleManager:
             current_replicas = deployment.spec.replicas or 0
 
             if current_replicas > 0:
-                # Already running, return current status
-                return self.get_mcp_status(name)
+                # Already running; answer from the deployment we just read
+                # instead of issuing a second full GET
+                return self._status_from_deployment(deployment)
 
-            # Scale to 1 replica
-            deployment.spec.replicas = 1
-            self.apps_v1.patch_namespaced_deployment(
-                name=name,
-                namespace=self.namespace,
-                body=deployment
-            )
+            # Scale to 1 replica through the /scale subresource: a tiny
+            # targeted patch instead of round-tripping the full deployment
+            self._patch_replicas(name, 1)
 
             # Wait for ready if requested
             if wait_ready:
@@ -367,9 +750,13 @@ class MCPLifecycleManager:
                     raise TimeoutError(
                         f"MCP server '{name}' did not become ready within {timeout} seconds"
                     )
+                # Readiness changed the status fields; report fresh state
+                return self.get_mcp_status(name)
 
-            # Return updated status
-            return self.get_mcp_status(name)
+            # Build the response from the deployment we already hold
+            # instead of re-reading it
+            deployment.spec.replicas = 1
+            return self._status_from_deployment(deployment)
 
         except ValueError:
             raise
@@ -400,23 +787,27 @@ class MCPLifecycleManager:
             current_replicas = deployment.spec.replicas or 0
 
             if current_replicas == 0:
-                # Already stopped, return current status
-                return self.get_mcp_status(name)
+                # Already stopped; answer from the deployment we just read
+                # instead of issuing a second full GET
+                return self._status_from_deployment(deployment)
 
-            # Scale to 0 replicas
-            deployment.spec.replicas = 0
-
-            # Handle force shutdown
+            # Force shutdown drops the grace period and scales down in one
+            # merge patch; a graceful stop is just the tiny /scale patch
             if force:
-                # Set terminationGracePeriodSeconds to 0 for immediate termination
-                if deployment.spec.template.spec.termination_grace_period_seconds != 0:
-                    deployment.spec.template.spec.termination_grace_period_seconds = 0
-
-            self.apps_v1.patch_namespaced_deployment(
-                name=name,
-                namespace=self.namespace,
-                body=deployment
-            )
+                self.apps_v1.patch_namespaced_deployment(
+                    name=name,
+                    namespace=self.namespace,
+                    body={
+                        "spec": {
+                            "replicas": 0,
+                            "template": {
+                                "spec": {"terminationGracePeriodSeconds": 0}
+                            }
+                        }
+                    }
+                )
+            else:
+                self._patch_replicas(name, 0)
 
             # If force, delete pods immediately
             if force:
@@ -430,9 +821,11 @@ class MCPLifecycleManager:
                     # Ignore errors during forced pod deletion
                     pass
 
-            # Return updated status
-            time.sleep(1)  # Brief pause to allow status to update
-            return self.get_mcp_status(name)
+            # Respond from the deployment we already hold; pod teardown is
+            # asynchronous either way, so a fresh GET (and the old fixed
+            # sleep) bought nothing
+            deployment.spec.replicas = 0
+            return self._status_from_deployment(deployment)
 
         except ValueError:
             raise
@@ -467,16 +860,12 @@ class MCPLifecycleManager:
             current_replicas = deployment.spec.replicas or 0
 
             if current_replicas == replicas:
-                # Already at desired scale, return current status
-                return self.get_mcp_status(name)
+                # Already at desired scale; answer from the deployment we
+                # just read instead of issuing a second full GET
+                return self._status_from_deployment(deployment)
 
-            # Update replica count
-            deployment.spec.replicas = replicas
-            self.apps_v1.patch_namespaced_deployment(
-                name=name,
-                namespace=self.namespace,
-                body=deployment
-            )
+            # Update replica count via the /scale subresource
+            self._patch_replicas(name, replicas)
 
             # Wait for ready if requested
             if wait_ready and replicas > 0:
@@ -485,9 +874,11 @@ class MCPLifecycleManager:
                     raise TimeoutError(
                         f"MCP server '{name}' did not scale to {replicas} replicas within {timeout} seconds"
                     )
+                return self.get_mcp_status(name)
 
-            # Return updated status
-            return self.get_mcp_status(name)
+            # Respond from the deployment we already hold
+            deployment.spec.replicas = replicas
+            return self._status_from_deployment(deployment)
 
         except ValueError:
             raise
@@ -499,12 +890,15 @@ class MCPLifecycleManager:
 
 # Convenience functions for direct usage
 
-_manager_instance = None
-
-
+@lru_cache(maxsize=None)
 def get_manager(namespace: str = "default", kubeconfig_path: Optional[str] = None) -> MCPLifecycleManager:
     """
-    Get or create a singleton instance of MCPLifecycleManager.
+    Get or create the shared MCPLifecycleManager for a namespace.
+
+    Managers are cached per (namespace, kubeconfig_path) so each namespace
+    reuses one Kubernetes API client (and its connection pool) across calls
+    instead of paying a fresh TLS handshake per convenience-function call.
+    lru_cache also makes creation thread-safe.
 
     Args:
         namespace: Kubernetes namespace
@@ -513,25 +907,27 @@ def get_manager(namespace: str = "default", kubeconfig_path: Optional[str] = Non
     Returns:
         MCPLifecycleManager instance
     """
-    global _manager_instance
-    if _manager_instance is None:
-        _manager_instance = MCPLifecycleManager(namespace, kubeconfig_path)
-    return _manager_instance
+    return MCPLifecycleManager(namespace, kubeconfig_path)
 
 
-def list_mcp_servers(namespace: str = "default", label_selector: str = "app.kubernetes.io/component=mcp-server") -> List[Dict[str, Any]]:
+def list_mcp_servers(
+    namespace: str = "default",
+    label_selector: str = "app.kubernetes.io/component=mcp-server",
+    field_selector: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """
     List all registered MCP servers.
 
     Args:
         namespace: Kubernetes namespace
         label_selector: Label selector to filter MCP deployments
+        field_selector: Optional field selector for server-side filtering
 
     Returns:
         List of MCP server information dictionaries
     """
     manager = get_manager(namespace)
-    return manager.list_mcp_servers(label_selector)
+    return manager.list_mcp_servers(label_selector, field_selector)
 
 
 def get_mcp_status(name: str, namespace: str = "default") -> Dict[str, Any]:
@@ -549,6 +945,21 @@ def get_mcp_status(name: str, namespace: str = "default") -> Dict[str, Any]:
     return manager.get_mcp_status(name)
 
 
+def get_mcp_statuses(names: List[str], namespace: str = "default") -> List[Dict[str, Any]]:
+    """
+    Get detailed status of several MCP servers concurrently.
+
+    Args:
+        names: MCP server names to query
+        namespace: Kubernetes namespace
+
+    Returns:
+        List of MCP server status dictionaries in the same order as names
+    """
+    manager = get_manager(namespace)
+    return manager.get_mcp_statuses(names)
+
+
 def start_mcp(name: str, wait_ready: bool = True, timeout: int = 300, namespace: str = "default") -> Dict[str, Any]:
     """
     Start an MCP server.
@@ -604,6 +1015,7 @@ __all__ = [
     "MCPLifecycleManager",
     "list_mcp_servers",
     "get_mcp_status",
+    "get_mcp_statuses",
     "start_mcp",
     "stop_mcp",
     "scale_mcp",
@@ -11,5 +11,16 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from src.server import main
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 if __name__ == "__main__":
+    # Prefer libuv's C event loop for the stdio hot path when available;
+    # on Windows, use the selector loop to avoid proactor idle CPU burn
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    elif uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
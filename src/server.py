@@ -4,7 +4,11 @@ Exposes resource allocation tools via MCP protocol.
 """
 
 import asyncio
-import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
 from typing import Any, Optional
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
@@ -16,21 +20,330 @@ from mcp.types import (
     EmbeddedResource,
 )
 
-from allocation_manager import AllocationManager
-from worker_manager import WorkerManager, WorkerManagerError
+from allocation_manager import AllocationManager, serialize
+from worker_manager import WorkerManager
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+logger = logging.getLogger(__name__)
+
+
+def _setup_logging() -> None:
+    """
+    Route logs to stderr through a queue.
+
+    stdout carries the MCP wire protocol, so nothing may print there; the
+    queue hands formatting and the stderr write to a listener thread so
+    the event loop never blocks on terminal I/O.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(name)s %(levelname)s %(message)s")
+    )
+    listener = logging.handlers.QueueListener(log_queue, stderr_handler)
+    listener.start()
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+
+# The tool catalogue is static: build the Tool models once at import
+# instead of reconstructing every schema on each tools/list request
+_TOOLS: list[Tool] = [
+    Tool(
+        name="request_resources",
+        description=(
+            "Reserve resources for a job. Starts required MCP servers, "
+            "provisions workers if requested, and tracks allocation with unique ID. "
+            "Returns allocation details including endpoints and worker information."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "job_id": {
+                    "type": "string",
+                    "description": "Unique job identifier"
+                },
+                "mcp_servers": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of MCP server names to start (e.g., ['filesystem', 'github', 'database'])"
+                },
+                "workers": {
+                    "type": "integer",
+                    "description": "Number of workers to provision (optional)",
+                    "minimum": 0
+                },
+                "priority": {
+                    "type": "string",
+                    "enum": ["low", "normal", "high", "critical"],
+                    "description": "Job priority level",
+                    "default": "normal"
+                },
+                "ttl_seconds": {
+                    "type": "integer",
+                    "description": "Time-to-live for allocation in seconds",
+                    "default": 3600,
+                    "minimum": 60
+                },
+                "metadata": {
+                    "type": "object",
+                    "description": "Additional metadata for the allocation"
+                }
+            },
+            "required": ["job_id", "mcp_servers"]
+        }
+    ),
+    Tool(
+        name="release_resources",
+        description=(
+            "Release resources after job completion. Scales down MCP servers "
+            "(or marks for idle timeout), queues burst workers for destruction, "
+            "and updates allocation status."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "allocation_id": {
+                    "type": "string",
+                    "description": "Allocation identifier to release"
+                }
+            },
+            "required": ["allocation_id"]
+        }
+    ),
+    Tool(
+        name="get_capacity",
+        description=(
+            "Return current cluster capacity including available CPU, memory, "
+            "workers, running MCP servers, and active allocations."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="get_allocation",
+        description=(
+            "Get details of a specific allocation including status, resources, "
+            "age, and job information."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "allocation_id": {
+                    "type": "string",
+                    "description": "Allocation identifier to query"
+                }
+            },
+            "required": ["allocation_id"]
+        }
+    ),
+    Tool(
+        name="list_allocations",
+        description=(
+            "List allocations with optional filtering by state or job_id. "
+            "Returns summary information for each allocation."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "state": {
+                    "type": "string",
+                    "enum": ["pending", "active", "releasing", "released", "failed"],
+                    "description": "Filter by allocation state (optional)"
+                },
+                "job_id": {
+                    "type": "string",
+                    "description": "Filter by job ID (optional)"
+                }
+            }
+        }
+    ),
+    Tool(
+        name="cleanup_expired",
+        description=(
+            "Manually trigger cleanup of expired allocations. "
+            "Returns list of cleaned up allocation IDs."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="list_workers",
+        description=(
+            "List all Kubernetes workers with their status, type, and resources. "
+            "Optionally filter by worker type (permanent or burst)."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type_filter": {
+                    "type": "string",
+                    "enum": ["permanent", "burst"],
+                    "description": "Filter workers by type (optional)"
+                }
+            }
+        }
+    ),
+    Tool(
+        name="provision_workers",
+        description=(
+            "Create burst workers by provisioning VMs and joining them to the Kubernetes cluster. "
+            "Burst workers are temporary and will be automatically cleaned up after TTL expires. "
+            "Uses Talos or Proxmox MCP to create VMs."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "count": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": 10,
+                    "description": "Number of workers to provision (1-10)"
+                },
+                "ttl": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": 168,
+                    "description": "Time-to-live in hours (1-168, max 1 week)"
+                },
+                "size": {
+                    "type": "string",
+                    "enum": ["small", "medium", "large"],
+                    "default": "medium",
+                    "description": "Worker size (small: 2 CPU/4GB, medium: 4 CPU/8GB, large: 8 CPU/16GB)"
+                }
+            },
+            "required": ["count", "ttl"]
+        }
+    ),
+    Tool(
+        name="drain_worker",
+        description=(
+            "Gracefully drain a worker node by moving all pods to other nodes and marking it as unschedulable. "
+            "This should be done before destroying a worker to ensure no service disruption."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "worker_id": {
+                    "type": "string",
+                    "description": "Worker node name to drain"
+                }
+            },
+            "required": ["worker_id"]
+        }
+    ),
+    Tool(
+        name="destroy_worker",
+        description=(
+            "Destroy a burst worker by removing it from the cluster and deleting the VM. "
+            "SAFETY: Only burst workers can be destroyed - permanent workers are protected. "
+            "Worker should be drained first unless force=True (not recommended)."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "worker_id": {
+                    "type": "string",
+                    "description": "Worker node name to destroy"
+                },
+                "force": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Force destroy without draining first (use with caution)"
+                }
+            },
+            "required": ["worker_id"]
+        }
+    ),
+    Tool(
+        name="get_worker_details",
+        description=(
+            "Get detailed information about a specific worker including status, "
+            "resources, labels, annotations, and conditions."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "worker_id": {
+                    "type": "string",
+                    "description": "Worker node name"
+                }
+            },
+            "required": ["worker_id"]
+        }
+    )
+]
+
+
+# Longest arguments repr echoed back in an error payload, and the opt-in
+# switch for echoing argument values at all (key names only by default)
+_ERR_ARGS_LIMIT = 512
+_DEBUG_ECHO_ARGS = os.environ.get("MCP_DEBUG_ECHO_ARGS") == "1"
+
+# Largest serialized arguments payload accepted: an unbounded metadata
+# blob would otherwise be stored on the allocation and re-emitted by
+# every subsequent get/list response
+MAX_ARGS_BYTES = 64 * 1024
+
+# Tools that leave process memory (kubectl subprocesses, VM RPCs) and must
+# not run on the event loop; allocation tools are in-memory bookkeeping
+_BLOCKING_TOOLS = frozenset({
+    "list_workers",
+    "provision_workers",
+    "drain_worker",
+    "destroy_worker",
+    "get_worker_details",
+})
 
 
 class ResourceManagerServer:
     """MCP Server for resource management"""
 
+    __slots__ = (
+        "server",
+        "allocation_manager",
+        "worker_manager",
+        "cleanup_task",
+        "_cleanup_wakeup",
+        "_dispatch",
+    )
+
     def __init__(self):
         self.server = Server("resource-manager")
         self.allocation_manager = AllocationManager()
         self.worker_manager = WorkerManager()
+
+        # Tool name -> bound handler: one hash lookup per call instead of
+        # walking an eleven-branch if/elif chain
+        self._dispatch = {
+            "request_resources": self._tool_request_resources,
+            "release_resources": self._tool_release_resources,
+            "get_capacity": self._tool_get_capacity,
+            "get_allocation": self._tool_get_allocation,
+            "list_allocations": self._tool_list_allocations,
+            "cleanup_expired": self._tool_cleanup_expired,
+            "list_workers": self._tool_list_workers,
+            "provision_workers": self._tool_provision_workers,
+            "drain_worker": self._tool_drain_worker,
+            "destroy_worker": self._tool_destroy_worker,
+            "get_worker_details": self._tool_get_worker_details,
+        }
         self._setup_handlers()
 
-        # Background task for cleanup
+        # Background task for cleanup, plus a wakeup signal so allocation
+        # changes can re-arm its timer instead of waiting out a fixed tick
         self.cleanup_task: Optional[asyncio.Task] = None
+        self._cleanup_wakeup = asyncio.Event()
 
     def _setup_handlers(self):
         """Setup MCP protocol handlers"""
@@ -38,372 +351,196 @@ class ResourceManagerServer:
         @self.server.list_tools()
         async def handle_list_tools() -> list[Tool]:
             """List available resource management tools"""
-            return [
-                Tool(
-                    name="request_resources",
-                    description=(
-                        "Reserve resources for a job. Starts required MCP servers, "
-                        "provisions workers if requested, and tracks allocation with unique ID. "
-                        "Returns allocation details including endpoints and worker information."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "job_id": {
-                                "type": "string",
-                                "description": "Unique job identifier"
-                            },
-                            "mcp_servers": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "List of MCP server names to start (e.g., ['filesystem', 'github', 'database'])"
-                            },
-                            "workers": {
-                                "type": "integer",
-                                "description": "Number of workers to provision (optional)",
-                                "minimum": 0
-                            },
-                            "priority": {
-                                "type": "string",
-                                "enum": ["low", "normal", "high", "critical"],
-                                "description": "Job priority level",
-                                "default": "normal"
-                            },
-                            "ttl_seconds": {
-                                "type": "integer",
-                                "description": "Time-to-live for allocation in seconds",
-                                "default": 3600,
-                                "minimum": 60
-                            },
-                            "metadata": {
-                                "type": "object",
-                                "description": "Additional metadata for the allocation"
-                            }
-                        },
-                        "required": ["job_id", "mcp_servers"]
-                    }
-                ),
-                Tool(
-                    name="release_resources",
-                    description=(
-                        "Release resources after job completion. Scales down MCP servers "
-                        "(or marks for idle timeout), queues burst workers for destruction, "
-                        "and updates allocation status."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "allocation_id": {
-                                "type": "string",
-                                "description": "Allocation identifier to release"
-                            }
-                        },
-                        "required": ["allocation_id"]
-                    }
-                ),
-                Tool(
-                    name="get_capacity",
-                    description=(
-                        "Return current cluster capacity including available CPU, memory, "
-                        "workers, running MCP servers, and active allocations."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {}
-                    }
-                ),
-                Tool(
-                    name="get_allocation",
-                    description=(
-                        "Get details of a specific allocation including status, resources, "
-                        "age, and job information."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "allocation_id": {
-                                "type": "string",
-                                "description": "Allocation identifier to query"
-                            }
-                        },
-                        "required": ["allocation_id"]
-                    }
-                ),
-                Tool(
-                    name="list_allocations",
-                    description=(
-                        "List allocations with optional filtering by state or job_id. "
-                        "Returns summary information for each allocation."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "state": {
-                                "type": "string",
-                                "enum": ["pending", "active", "releasing", "released", "failed"],
-                                "description": "Filter by allocation state (optional)"
-                            },
-                            "job_id": {
-                                "type": "string",
-                                "description": "Filter by job ID (optional)"
-                            }
-                        }
-                    }
-                ),
-                Tool(
-                    name="cleanup_expired",
-                    description=(
-                        "Manually trigger cleanup of expired allocations. "
-                        "Returns list of cleaned up allocation IDs."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {}
-                    }
-                ),
-                Tool(
-                    name="list_workers",
-                    description=(
-                        "List all Kubernetes workers with their status, type, and resources. "
-                        "Optionally filter by worker type (permanent or burst)."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "type_filter": {
-                                "type": "string",
-                                "enum": ["permanent", "burst"],
-                                "description": "Filter workers by type (optional)"
-                            }
-                        }
-                    }
-                ),
-                Tool(
-                    name="provision_workers",
-                    description=(
-                        "Create burst workers by provisioning VMs and joining them to the Kubernetes cluster. "
-                        "Burst workers are temporary and will be automatically cleaned up after TTL expires. "
-                        "Uses Talos or Proxmox MCP to create VMs."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "count": {
-                                "type": "integer",
-                                "minimum": 1,
-                                "maximum": 10,
-                                "description": "Number of workers to provision (1-10)"
-                            },
-                            "ttl": {
-                                "type": "integer",
-                                "minimum": 1,
-                                "maximum": 168,
-                                "description": "Time-to-live in hours (1-168, max 1 week)"
-                            },
-                            "size": {
-                                "type": "string",
-                                "enum": ["small", "medium", "large"],
-                                "default": "medium",
-                                "description": "Worker size (small: 2 CPU/4GB, medium: 4 CPU/8GB, large: 8 CPU/16GB)"
-                            }
-                        },
-                        "required": ["count", "ttl"]
-                    }
-                ),
-                Tool(
-                    name="drain_worker",
-                    description=(
-                        "Gracefully drain a worker node by moving all pods to other nodes and marking it as unschedulable. "
-                        "This should be done before destroying a worker to ensure no service disruption."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "worker_id": {
-                                "type": "string",
-                                "description": "Worker node name to drain"
-                            }
-                        },
-                        "required": ["worker_id"]
-                    }
-                ),
-                Tool(
-                    name="destroy_worker",
-                    description=(
-                        "Destroy a burst worker by removing it from the cluster and deleting the VM. "
-                        "SAFETY: Only burst workers can be destroyed - permanent workers are protected. "
-                        "Worker should be drained first unless force=True (not recommended)."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "worker_id": {
-                                "type": "string",
-                                "description": "Worker node name to destroy"
-                            },
-                            "force": {
-                                "type": "boolean",
-                                "default": False,
-                                "description": "Force destroy without draining first (use with caution)"
-                            }
-                        },
-                        "required": ["worker_id"]
-                    }
-                ),
-                Tool(
-                    name="get_worker_details",
-                    description=(
-                        "Get detailed information about a specific worker including status, "
-                        "resources, labels, annotations, and conditions."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "worker_id": {
-                                "type": "string",
-                                "description": "Worker node name"
-                            }
-                        },
-                        "required": ["worker_id"]
-                    }
-                )
-            ]
+            return _TOOLS
 
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
             """Handle tool execution"""
             try:
-                if name == "request_resources":
-                    result = self.allocation_manager.request_resources(
-                        job_id=arguments["job_id"],
-                        mcp_servers=arguments["mcp_servers"],
-                        workers=arguments.get("workers"),
-                        priority=arguments.get("priority", "normal"),
-                        ttl_seconds=arguments.get("ttl_seconds", 3600),
-                        metadata=arguments.get("metadata")
-                    )
-
-                elif name == "release_resources":
-                    result = self.allocation_manager.release_resources(
-                        allocation_id=arguments["allocation_id"]
-                    )
-
-                elif name == "get_capacity":
-                    result = self.allocation_manager.get_capacity()
-
-                elif name == "get_allocation":
-                    result = self.allocation_manager.get_allocation(
-                        allocation_id=arguments["allocation_id"]
-                    )
-                    if result is None:
-                        result = {
-                            "error": f"Allocation {arguments['allocation_id']} not found"
-                        }
-
-                elif name == "list_allocations":
-                    result = self.allocation_manager.list_allocations(
-                        state=arguments.get("state"),
-                        job_id=arguments.get("job_id")
-                    )
-
-                elif name == "cleanup_expired":
-                    expired_ids = self.allocation_manager.cleanup_expired_allocations()
-                    result = {
-                        "cleaned_up": expired_ids,
-                        "count": len(expired_ids)
-                    }
-
-                elif name == "list_workers":
-                    type_filter = arguments.get("type_filter")
-                    workers = self.worker_manager.list_workers(type_filter=type_filter)
-                    result = {
-                        "workers": workers,
-                        "count": len(workers),
-                        "filter": type_filter or "none"
-                    }
-
-                elif name == "provision_workers":
-                    count = arguments.get("count")
-                    ttl = arguments.get("ttl")
-                    size = arguments.get("size", "medium")
-                    workers = self.worker_manager.provision_workers(
-                        count=count,
-                        ttl=ttl,
-                        size=size
-                    )
-                    result = {
-                        "provisioned_workers": workers,
-                        "count": len(workers),
-                        "size": size,
-                        "ttl_hours": ttl
-                    }
-
-                elif name == "drain_worker":
-                    worker_id = arguments.get("worker_id")
-                    result = self.worker_manager.drain_worker(worker_id)
-
-                elif name == "destroy_worker":
-                    worker_id = arguments.get("worker_id")
-                    force = arguments.get("force", False)
-                    result = self.worker_manager.destroy_worker(
-                        worker_id=worker_id,
-                        force=force
-                    )
-
-                elif name == "get_worker_details":
-                    worker_id = arguments.get("worker_id")
-                    result = self.worker_manager.get_worker_details(worker_id)
+                if len(serialize(arguments)) > MAX_ARGS_BYTES:
+                    return [
+                        TextContent(
+                            type="text",
+                            text=serialize({
+                                "error": f"Arguments exceed {MAX_ARGS_BYTES} bytes",
+                                "error_type": "ValueError",
+                                "tool": name,
+                                "arguments": list(arguments)
+                            })
+                        )
+                    ]
 
+                # Worker tools shell out to kubectl, so they run on a thread
+                # to keep the stdio event loop responsive. Allocation tools
+                # are pure in-memory bookkeeping; calling them inline skips
+                # the thread hop.
+                if name in _BLOCKING_TOOLS:
+                    result = await asyncio.to_thread(self._dispatch_tool, name, arguments)
                 else:
-                    result = {"error": f"Unknown tool: {name}"}
+                    result = self._dispatch_tool(name, arguments)
 
+                # Responses are machine-consumed: skip indentation and let
+                # serialize() use orjson's C encoder when it is installed
                 return [
                     TextContent(
                         type="text",
-                        text=json.dumps(result, indent=2)
+                        text=serialize(result)
                     )
                 ]
 
-            except WorkerManagerError as e:
-                return [
-                    TextContent(
-                        type="text",
-                        text=json.dumps({
-                            "error": str(e),
-                            "error_type": "WorkerManagerError",
-                            "tool": name,
-                            "arguments": arguments
-                        }, indent=2)
-                    )
-                ]
             except Exception as e:
+                # One handler for both manager and unexpected errors. The
+                # caller already has its own arguments, so by default only
+                # the key names come back; full (capped) echo is opt-in for
+                # debugging via MCP_DEBUG_ECHO_ARGS=1.
+                if _DEBUG_ECHO_ARGS:
+                    args_info: Any = repr(arguments)
+                    if len(args_info) > _ERR_ARGS_LIMIT:
+                        args_info = args_info[:_ERR_ARGS_LIMIT] + "..."
+                else:
+                    args_info = list(arguments)
                 return [
                     TextContent(
                         type="text",
-                        text=json.dumps({
+                        text=serialize({
                             "error": str(e),
                             "error_type": type(e).__name__,
                             "tool": name,
-                            "arguments": arguments
-                        }, indent=2)
+                            "arguments": args_info
+                        })
                     )
                 ]
 
+    def _dispatch_tool(self, name: str, arguments: dict) -> Any:
+        """Execute one tool call synchronously and return its result payload"""
+        # Interning lets the table probe reuse the cached hash and hit the
+        # identity short-circuit instead of comparing the fresh parser
+        # string character by character
+        handler = self._dispatch.get(sys.intern(name))
+        if handler is None:
+            return {"error": f"Unknown tool: {name}"}
+        return handler(arguments)
+
+    def _tool_request_resources(self, arguments: dict) -> Any:
+        result = self.allocation_manager.request_resources(
+            job_id=arguments["job_id"],
+            mcp_servers=arguments["mcp_servers"],
+            workers=arguments.get("workers"),
+            priority=arguments.get("priority", "normal"),
+            ttl_seconds=arguments.get("ttl_seconds", 3600),
+            metadata=arguments.get("metadata")
+        )
+        # A fresh TTL may move the nearest expiry earlier
+        self._cleanup_wakeup.set()
+        return result
+
+    def _tool_release_resources(self, arguments: dict) -> Any:
+        result = self.allocation_manager.release_resources(
+            allocation_id=arguments["allocation_id"]
+        )
+        self._cleanup_wakeup.set()
+        return result
+
+    def _tool_get_capacity(self, arguments: dict) -> Any:
+        return self.allocation_manager.get_capacity()
+
+    def _tool_get_allocation(self, arguments: dict) -> Any:
+        result = self.allocation_manager.get_allocation(
+            allocation_id=arguments["allocation_id"]
+        )
+        if result is None:
+            result = {
+                "error": f"Allocation {arguments['allocation_id']} not found"
+            }
+        return result
+
+    def _tool_list_allocations(self, arguments: dict) -> Any:
+        return self.allocation_manager.list_allocations(
+            state=arguments.get("state"),
+            job_id=arguments.get("job_id")
+        )
+
+    def _tool_cleanup_expired(self, arguments: dict) -> Any:
+        expired_ids = self.allocation_manager.cleanup_expired_allocations()
+        return {
+            "cleaned_up": expired_ids,
+            "count": len(expired_ids)
+        }
+
+    def _tool_list_workers(self, arguments: dict) -> Any:
+        type_filter = arguments.get("type_filter")
+        workers = self.worker_manager.list_workers(type_filter=type_filter)
+        return {
+            "workers": workers,
+            "count": len(workers),
+            "filter": type_filter or "none"
+        }
+
+    def _tool_provision_workers(self, arguments: dict) -> Any:
+        count = arguments.get("count")
+        ttl = arguments.get("ttl")
+        size = arguments.get("size", "medium")
+        workers = self.worker_manager.provision_workers(
+            count=count,
+            ttl=ttl,
+            size=size
+        )
+        return {
+            "provisioned_workers": workers,
+            "count": len(workers),
+            "size": size,
+            "ttl_hours": ttl
+        }
+
+    def _tool_drain_worker(self, arguments: dict) -> Any:
+        return self.worker_manager.drain_worker(arguments.get("worker_id"))
+
+    def _tool_destroy_worker(self, arguments: dict) -> Any:
+        return self.worker_manager.destroy_worker(
+            worker_id=arguments.get("worker_id"),
+            force=arguments.get("force", False)
+        )
+
+    def _tool_get_worker_details(self, arguments: dict) -> Any:
+        return self.worker_manager.get_worker_details(arguments.get("worker_id"))
+
     async def _periodic_cleanup(self):
-        """Periodically clean up expired allocations"""
+        """Clean up expired allocations, waking at the nearest TTL deadline"""
         while True:
             try:
-                await asyncio.sleep(300)  # Every 5 minutes
+                # Sleep until the earliest active allocation expires (capped
+                # at 5 minutes), or until an allocation change re-arms us
+                next_expiry = self.allocation_manager.seconds_until_next_expiry()
+                delay = 300.0 if next_expiry is None else max(1.0, min(300.0, next_expiry))
+                try:
+                    await asyncio.wait_for(self._cleanup_wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                self._cleanup_wakeup.clear()
+
+                # Inline on the loop thread: the allocation manager is
+                # unlocked in-memory state and every other caller (including
+                # the cleanup_expired tool) already mutates it here, so
+                # offloading to a thread would race the heap and capacity
+                # bookkeeping. The call is O(expired) dict work.
                 expired = self.allocation_manager.cleanup_expired_allocations()
                 if expired:
-                    print(f"Cleaned up {len(expired)} expired allocations: {expired}")
+                    logger.info(
+                        "Cleaned up %d expired allocations: %s", len(expired), expired
+                    )
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                print(f"Error in periodic cleanup: {e}")
+                logger.error("Error in periodic cleanup: %s", e)
 
     async def run(self):
         """Run the MCP server"""
+        # Eager tasks (3.12+) run coroutines up to their first real
+        # suspension without a trip through the ready queue, which trims
+        # scheduling overhead off every short-lived per-request task
+        if sys.version_info >= (3, 12):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
         # Start background cleanup task
         self.cleanup_task = asyncio.create_task(self._periodic_cleanup())
 
@@ -433,9 +570,18 @@ class ResourceManagerServer:
 
 async def main():
     """Main entry point"""
+    _setup_logging()
     server = ResourceManagerServer()
     await server.run()
 
 
 if __name__ == "__main__":
+    # libuv's C event loop cuts per-event overhead on the stdio framing
+    # hot path; fall back to the stock loop where uvloop is unavailable.
+    # On Windows, avoid the proactor loop, which busy-waits on IOCP and
+    # burns idle CPU while parked on stdio and long timer sleeps.
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    elif uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
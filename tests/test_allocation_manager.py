@@ -16,7 +16,8 @@ from allocation_manager import (
     AllocationState,
     Priority,
     ResourceAllocation,
-    ClusterCapacity
+    ClusterCapacity,
+    serialize
 )
 
 
@@ -216,6 +217,67 @@ class TestAllocationManager:
         assert len(details['mcp_servers']) == 2
         assert details['metadata']['test'] == 'value'
 
+    def test_payloads_serialize_without_default(self):
+        """Test responses contain only JSON-native values"""
+        import json
+
+        manager = AllocationManager()
+        result = manager.request_resources(
+            job_id="test-job-json",
+            mcp_servers=["filesystem"],
+            workers=2
+        )
+        allocation_id = result['allocation_id']
+
+        # json.dumps with no default= raises on datetime/Enum leftovers
+        for payload in (
+            result,
+            manager.get_allocation(allocation_id),
+            manager.get_capacity(),
+            manager.list_allocations(),
+            manager.release_resources(allocation_id)
+        ):
+            json.dumps(payload)
+            assert serialize(payload)
+
+    def test_request_resources_bulk(self):
+        """Test batch admission admits the longest prefix that fits"""
+        manager = AllocationManager(total_workers=10)
+
+        results = manager.request_resources_bulk([
+            {'job_id': 'bulk-job-001', 'mcp_servers': ['filesystem'], 'workers': 4},
+            {'job_id': 'bulk-job-002', 'mcp_servers': ['github'], 'workers': 4},
+            {'job_id': 'bulk-job-003', 'mcp_servers': ['filesystem'], 'workers': 4}
+        ])
+
+        assert [r['status'] for r in results] == ['active', 'active', 'failed']
+        assert 'Insufficient capacity' in results[2]['error']
+        assert manager.capacity.allocated_workers == 8
+        # Rejected requests leave no allocation record behind
+        assert len(manager.list_allocations()) == 2
+
+    def test_get_allocation_cache_invalidation(self):
+        """Test cached payloads are reused and invalidated on state change"""
+        manager = AllocationManager()
+
+        result = manager.request_resources(
+            job_id="test-job-009a",
+            mcp_servers=["filesystem"],
+            workers=2
+        )
+        allocation_id = result['allocation_id']
+
+        first = manager.get_allocation(allocation_id)
+        second = manager.get_allocation(allocation_id)
+        assert second['state'] == first['state'] == 'active'
+        assert manager.dict_cache_hits == 1
+
+        # Release must invalidate the cached payload
+        manager.release_resources(allocation_id)
+        details = manager.get_allocation(allocation_id)
+        assert details['state'] == 'released'
+        assert details['workers'][0]['status'] == 'destroying'
+
     def test_get_nonexistent_allocation(self):
         """Test getting non-existent allocation"""
         manager = AllocationManager()
@@ -254,6 +316,35 @@ class TestAllocationManager:
         assert len(job_allocations) == 1
         assert job_allocations[0]['job_id'] == "test-job-010"
 
+    def test_list_allocations_combined_filters(self):
+        """Test listing with both state and job_id filters"""
+        manager = AllocationManager()
+
+        result = manager.request_resources(
+            job_id="test-job-010a",
+            mcp_servers=["filesystem"],
+            workers=2
+        )
+        manager.request_resources(
+            job_id="test-job-010b",
+            mcp_servers=["github"],
+            workers=2
+        )
+
+        # Both filters intersect
+        matches = manager.list_allocations(state="active", job_id="test-job-010a")
+        assert len(matches) == 1
+        assert matches[0]['allocation_id'] == result['allocation_id']
+
+        # Index follows the state transition on release
+        manager.release_resources(result['allocation_id'])
+        assert manager.list_allocations(state="active", job_id="test-job-010a") == []
+        released = manager.list_allocations(state="released", job_id="test-job-010a")
+        assert len(released) == 1
+
+        # Unknown state matches nothing
+        assert manager.list_allocations(state="bogus") == []
+
     def test_allocation_expiry(self):
         """Test allocation TTL expiry"""
         manager = AllocationManager()
@@ -279,6 +370,58 @@ class TestAllocationManager:
         details = manager.get_allocation(allocation_id)
         assert details['is_expired']
 
+    def test_watch_expiry_expired(self):
+        """Test watch yields an expired event at the TTL deadline"""
+        manager = AllocationManager()
+
+        result = manager.request_resources(
+            job_id="test-job-watch-001",
+            mcp_servers=["filesystem"],
+            ttl_seconds=1
+        )
+
+        events = list(manager.watch_expiry(result['allocation_id'], timeout=5))
+
+        assert len(events) == 1
+        assert events[0]['type'] == 'expired'
+
+    def test_watch_expiry_released(self):
+        """Test watch reports already-released allocations immediately"""
+        manager = AllocationManager()
+
+        result = manager.request_resources(
+            job_id="test-job-watch-002",
+            mcp_servers=["filesystem"]
+        )
+        manager.release_resources(result['allocation_id'])
+
+        events = list(manager.watch_expiry(result['allocation_id']))
+
+        assert len(events) == 1
+        assert events[0]['type'] == 'released'
+        assert events[0]['state'] == 'released'
+
+    def test_watch_expiry_timeout(self):
+        """Test watch times out before a long TTL elapses"""
+        manager = AllocationManager()
+
+        result = manager.request_resources(
+            job_id="test-job-watch-003",
+            mcp_servers=["filesystem"],
+            ttl_seconds=3600
+        )
+
+        events = list(manager.watch_expiry(result['allocation_id'], timeout=0.1))
+
+        assert len(events) == 1
+        assert events[0]['type'] == 'timeout'
+
+    def test_watch_expiry_missing_allocation(self):
+        """Test watch yields nothing for unknown allocations"""
+        manager = AllocationManager()
+
+        assert list(manager.watch_expiry("nonexistent-id")) == []
+
     def test_cleanup_expired_allocations(self):
         """Test cleanup of expired allocations"""
         manager = AllocationManager()
@@ -306,6 +449,47 @@ class TestAllocationManager:
         details = manager.get_allocation(allocation_id)
         assert details['state'] == 'released'
 
+    def test_seconds_until_next_expiry(self):
+        """Test the next-expiry deadline tracks active allocations"""
+        manager = AllocationManager()
+
+        assert manager.seconds_until_next_expiry() is None
+
+        result = manager.request_resources(
+            job_id="test-job-013b",
+            mcp_servers=["filesystem"],
+            workers=2,
+            ttl_seconds=3600
+        )
+
+        remaining = manager.seconds_until_next_expiry()
+        assert remaining is not None
+        assert 0 < remaining <= 3600
+
+        # Releasing the allocation leaves nothing scheduled to expire
+        manager.release_resources(result['allocation_id'])
+        assert manager.seconds_until_next_expiry() is None
+
+    def test_cleanup_skips_released_allocations(self):
+        """Test cleanup drops stale heap entries for released allocations"""
+        manager = AllocationManager()
+
+        result = manager.request_resources(
+            job_id="test-job-013a",
+            mcp_servers=["filesystem"],
+            workers=2,
+            ttl_seconds=1
+        )
+
+        # Release before the TTL sweep runs
+        manager.release_resources(result['allocation_id'])
+        time.sleep(2)
+
+        expired = manager.cleanup_expired_allocations()
+
+        assert expired == []
+        assert manager._expiry_heap == []
+
     def test_priority_levels(self):
         """Test different priority levels"""
         manager = AllocationManager()
@@ -140,6 +140,7 @@ class TestMCPLifecycleManager:
         """Test listing MCP servers."""
         deployments = Mock()
         deployments.items = [mock_deployment]
+        deployments.metadata._continue = None
 
         with patch.object(manager.apps_v1, 'list_namespaced_deployment', return_value=deployments):
             with patch.object(manager, '_get_service_endpoints', return_value=["http://10.0.0.1:8080"]):
@@ -152,6 +153,55 @@ class TestMCPLifecycleManager:
                 assert servers[0]['ready_replicas'] == 1
                 assert len(servers[0]['endpoints']) == 1
 
+    def test_iter_mcp_servers_is_lazy(self, manager, mock_deployment):
+        """Test that the streaming variant yields without a full LIST loop."""
+        deployments = Mock()
+        deployments.items = [mock_deployment, mock_deployment]
+        deployments.metadata._continue = None
+
+        with patch.object(manager.apps_v1, 'list_namespaced_deployment', return_value=deployments):
+            with patch.object(manager, '_get_service_endpoints', return_value=[]) as mock_endpoints:
+                it = manager.iter_mcp_servers()
+
+                # Nothing fetched until the generator is consumed
+                assert mock_endpoints.call_count == 0
+                first = next(it)
+                assert first['name'] == "test-mcp-server"
+                assert mock_endpoints.call_count == 1
+
+    def test_list_mcp_servers_field_selector(self, manager, mock_deployment):
+        """Test that a field selector is passed through to the apiserver."""
+        deployments = Mock()
+        deployments.items = [mock_deployment]
+        deployments.metadata._continue = None
+
+        with patch.object(manager.apps_v1, 'list_namespaced_deployment', return_value=deployments) as mock_list:
+            with patch.object(manager, '_get_service_endpoints', return_value=[]):
+                manager.list_mcp_servers(field_selector="metadata.name=test-mcp-server")
+
+                assert mock_list.call_args.kwargs['field_selector'] == "metadata.name=test-mcp-server"
+
+    def test_list_mcp_servers_paginated(self, manager, mock_deployment):
+        """Test that listing follows continue tokens across pages."""
+        page1 = Mock()
+        page1.items = [mock_deployment]
+        page1.metadata._continue = "next-page"
+
+        page2 = Mock()
+        page2.items = [mock_deployment]
+        page2.metadata._continue = None
+
+        with patch.object(manager.apps_v1, 'list_namespaced_deployment', side_effect=[page1, page2]) as mock_list:
+            with patch.object(manager, '_get_service_endpoints', return_value=[]):
+                servers = manager.list_mcp_servers()
+
+                assert len(servers) == 2
+                assert mock_list.call_count == 2
+                # First page should be served from the watch cache
+                assert mock_list.call_args_list[0].kwargs['resource_version'] == "0"
+                # Second page carries the continuation token instead
+                assert mock_list.call_args_list[1].kwargs['_continue'] == "next-page"
+
     def test_get_mcp_status(self, manager, mock_deployment):
         """Test getting detailed status of an MCP server."""
         with patch.object(manager, '_get_deployment', return_value=mock_deployment):
@@ -165,6 +215,19 @@ class TestMCPLifecycleManager:
                 assert status['available_replicas'] == 1
                 assert len(status['endpoints']) == 1
 
+    def test_get_mcp_statuses(self, manager, mock_deployment):
+        """Test fetching several server statuses concurrently."""
+        with patch.object(manager, '_get_deployment', return_value=mock_deployment):
+            with patch.object(manager, '_get_service_endpoints', return_value=[]):
+                statuses = manager.get_mcp_statuses(["server-a", "server-b"])
+
+                assert len(statuses) == 2
+                assert all(s['status'] == "running" for s in statuses)
+
+    def test_get_mcp_statuses_empty(self, manager):
+        """Test that an empty name list short-circuits without API calls."""
+        assert manager.get_mcp_statuses([]) == []
+
     def test_get_mcp_status_not_found(self, manager):
         """Test error handling when server not found."""
         error = ApiException(status=404)
@@ -179,12 +242,12 @@ class TestMCPLifecycleManager:
         mock_deployment.spec.replicas = 0
 
         with patch.object(manager, '_get_deployment', return_value=mock_deployment):
-            with patch.object(manager.apps_v1, 'patch_namespaced_deployment'):
+            with patch.object(manager.apps_v1, 'patch_namespaced_deployment_scale') as mock_scale:
                 with patch.object(manager, 'get_mcp_status', return_value={'name': 'test', 'status': 'running'}):
                     with patch.object(manager, '_wait_for_ready', return_value=True):
                         result = manager.start_mcp("test-mcp-server", wait_ready=True)
 
-                        assert mock_deployment.spec.replicas == 1
+                        assert mock_scale.call_args.kwargs['body'] == {"spec": {"replicas": 1}}
                         assert result['status'] == 'running'
 
     def test_start_mcp_already_running(self, manager, mock_deployment):
@@ -192,47 +255,57 @@ class TestMCPLifecycleManager:
         mock_deployment.spec.replicas = 1
 
         with patch.object(manager, '_get_deployment', return_value=mock_deployment):
-            with patch.object(manager, 'get_mcp_status', return_value={'name': 'test', 'status': 'running'}):
+            with patch.object(manager, '_get_service_endpoints', return_value=[]):
                 result = manager.start_mcp("test-mcp-server", wait_ready=False)
 
-                # Should return current status without changes
+                # Should return current status built from the deployment
+                # already in hand, without a second read
                 assert result['status'] == 'running'
+                assert result['replicas'] == 1
 
     def test_stop_mcp(self, manager, mock_deployment):
         """Test stopping an MCP server."""
         mock_deployment.spec.replicas = 1
 
         with patch.object(manager, '_get_deployment', return_value=mock_deployment):
-            with patch.object(manager.apps_v1, 'patch_namespaced_deployment'):
-                with patch.object(manager, 'get_mcp_status', return_value={'name': 'test', 'status': 'stopped'}):
+            with patch.object(manager.apps_v1, 'patch_namespaced_deployment_scale') as mock_scale:
+                with patch.object(manager, '_get_service_endpoints', return_value=[]):
                     result = manager.stop_mcp("test-mcp-server", force=False)
 
-                    assert mock_deployment.spec.replicas == 0
+                    assert mock_scale.call_args.kwargs['body'] == {"spec": {"replicas": 0}}
+                    # Response is built from the held deployment, no re-read
                     assert result['status'] == 'stopped'
+                    assert result['replicas'] == 0
 
     def test_stop_mcp_force(self, manager, mock_deployment):
         """Test force stopping an MCP server."""
         mock_deployment.spec.replicas = 1
 
         with patch.object(manager, '_get_deployment', return_value=mock_deployment):
-            with patch.object(manager.apps_v1, 'patch_namespaced_deployment'):
-                with patch.object(manager.core_v1, 'delete_collection_namespaced_pod'):
-                    with patch.object(manager, 'get_mcp_status', return_value={'name': 'test', 'status': 'stopped'}):
-                        result = manager.stop_mcp("test-mcp-server", force=True)
-
-                        assert mock_deployment.spec.replicas == 0
-                        assert mock_deployment.spec.template.spec.termination_grace_period_seconds == 0
+            with patch.object(manager.apps_v1, 'patch_namespaced_deployment_scale') as mock_scale:
+                with patch.object(manager.apps_v1, 'patch_namespaced_deployment') as mock_patch:
+                    with patch.object(manager.core_v1, 'delete_collection_namespaced_pod'):
+                        with patch.object(manager, '_get_service_endpoints', return_value=[]):
+                            result = manager.stop_mcp("test-mcp-server", force=True)
+
+                            # Single merge patch carries both the scale-down
+                            # and the grace-period drop
+                            mock_scale.assert_not_called()
+                            body = mock_patch.call_args.kwargs['body']
+                            assert body['spec']['replicas'] == 0
+                            assert body['spec']['template']['spec']['terminationGracePeriodSeconds'] == 0
+                            assert result['status'] == 'stopped'
 
     def test_scale_mcp(self, manager, mock_deployment):
         """Test scaling an MCP server."""
         mock_deployment.spec.replicas = 1
 
         with patch.object(manager, '_get_deployment', return_value=mock_deployment):
-            with patch.object(manager.apps_v1, 'patch_namespaced_deployment'):
-                with patch.object(manager, 'get_mcp_status', return_value={'name': 'test', 'replicas': 3}):
+            with patch.object(manager.apps_v1, 'patch_namespaced_deployment_scale') as mock_scale:
+                with patch.object(manager, '_get_service_endpoints', return_value=[]):
                     result = manager.scale_mcp("test-mcp-server", replicas=3, wait_ready=False)
 
-                    assert mock_deployment.spec.replicas == 3
+                    assert mock_scale.call_args.kwargs['body'] == {"spec": {"replicas": 3}}
                     assert result['replicas'] == 3
 
     def test_scale_mcp_invalid_replicas(self, manager, mock_deployment):
@@ -244,6 +317,67 @@ class TestMCPLifecycleManager:
             with pytest.raises(ValueError):
                 manager.scale_mcp("test-mcp-server", replicas=-1)
 
+    def test_shared_api_client_pool(self, manager):
+        """Test both API groups share one widened-connection-pool client."""
+        assert manager.apps_v1.api_client is manager.core_v1.api_client
+        assert manager.api_client.configuration.connection_pool_maxsize == 32
+
+    def test_watch_cache_serves_reads(self, manager, mock_deployment, mock_service):
+        """Test that enabled caches answer reads without apiserver GETs."""
+        from resource_manager_mcp_server import _ResourceCache
+
+        deployments = Mock()
+        deployments.items = [mock_deployment]
+        deployments.metadata.resource_version = "1"
+
+        mock_service.metadata = Mock()
+        mock_service.metadata.name = "test-mcp-server"
+        services = Mock()
+        services.items = [mock_service]
+        services.metadata.resource_version = "1"
+
+        with patch.object(manager.apps_v1, 'list_namespaced_deployment', return_value=deployments):
+            with patch.object(manager.core_v1, 'list_namespaced_service', return_value=services):
+                with patch.object(_ResourceCache, '_run', lambda self: None):
+                    manager.enable_watch_cache()
+
+        # Point reads must not fall through to the API
+        with patch.object(manager.apps_v1, 'read_namespaced_deployment') as mock_read_dep:
+            with patch.object(manager.core_v1, 'read_namespaced_service') as mock_read_svc:
+                assert manager._get_deployment("test-mcp-server") is mock_deployment
+                assert manager._get_service_endpoints("test-mcp-server") == ["http://10.0.0.1:8080"]
+
+                servers = manager.list_mcp_servers()
+                assert len(servers) == 1
+                assert servers[0]['name'] == "test-mcp-server"
+
+                mock_read_dep.assert_not_called()
+                mock_read_svc.assert_not_called()
+
+    def test_wait_for_ready_watch(self, manager, mock_deployment):
+        """Test readiness is detected from the deployment watch stream."""
+        not_ready = Mock()
+        not_ready.spec.replicas = 1
+        not_ready.status.ready_replicas = 0
+
+        mock_watch = Mock()
+        mock_watch.stream.return_value = iter([
+            {'object': not_ready},
+            {'object': mock_deployment}
+        ])
+
+        with patch('resource_manager_mcp_server.watch.Watch', return_value=mock_watch):
+            assert manager._wait_for_ready("test-mcp-server", timeout=5) is True
+            mock_watch.stop.assert_called_once()
+
+    def test_wait_for_ready_timeout(self, manager):
+        """Test timeout when the watch stream never reports readiness."""
+        mock_watch = Mock()
+        mock_watch.stream.return_value = iter([])
+
+        with patch('resource_manager_mcp_server.watch.Watch', return_value=mock_watch):
+            assert manager._wait_for_ready("test-mcp-server", timeout=0) is False
+
     def test_get_service_endpoints_clusterip(self, manager, mock_service):
         """Test getting ClusterIP service endpoints."""
         mock_service.spec.type = "ClusterIP"
@@ -263,6 +397,16 @@ class TestMCPLifecycleManager:
 
             assert endpoints == []
 
+    def test_get_service_endpoints_negative_cache(self, manager):
+        """Test that a 404 is remembered instead of re-fetched each call."""
+        error = ApiException(status=404)
+        with patch.object(manager.core_v1, 'read_namespaced_service', side_effect=error) as mock_read:
+            assert manager._get_service_endpoints("missing-service") == []
+            assert manager._get_service_endpoints("missing-service") == []
+
+            # Second call is served from the negative cache
+            assert mock_read.call_count == 1
+
 
 class TestConvenienceFunctions:
     """Test convenience functions."""
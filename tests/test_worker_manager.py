@@ -105,14 +105,10 @@ class TestWorkerManager:
         assert worker_manager.proxmox_mcp_endpoint == "test://proxmox"
         assert worker_manager.kubectl_context == "test-context"
 
-    @patch('worker_manager.subprocess.run')
-    def test_list_workers(self, mock_run, worker_manager, mock_kubectl_nodes):
+    @patch('worker_manager.WorkerManager._fetch_nodes')
+    def test_list_workers(self, mock_fetch, worker_manager, mock_kubectl_nodes):
         """Test listing all workers"""
-        # Mock kubectl get nodes
-        mock_run.return_value = Mock(
-            stdout=json.dumps(mock_kubectl_nodes),
-            returncode=0
-        )
+        mock_fetch.return_value = mock_kubectl_nodes["items"]
 
         workers = worker_manager.list_workers()
 
@@ -123,13 +119,10 @@ class TestWorkerManager:
         assert workers[1]['type'] == WorkerType.BURST.value
         assert 'ttl_expires' in workers[1]
 
-    @patch('worker_manager.subprocess.run')
-    def test_list_workers_with_filter(self, mock_run, worker_manager, mock_kubectl_nodes):
+    @patch('worker_manager.WorkerManager._fetch_nodes')
+    def test_list_workers_with_filter(self, mock_fetch, worker_manager, mock_kubectl_nodes):
         """Test listing workers with type filter"""
-        mock_run.return_value = Mock(
-            stdout=json.dumps(mock_kubectl_nodes),
-            returncode=0
-        )
+        mock_fetch.return_value = mock_kubectl_nodes["items"]
 
         # Filter for burst workers only
         burst_workers = worker_manager.list_workers(type_filter="burst")
@@ -148,7 +141,8 @@ class TestWorkerManager:
                 "labels": {"worker-type": "burst"}
             }
         }
-        assert worker_manager._get_node_type(node) == WorkerType.BURST
+        view = worker_manager._to_view(node)
+        assert worker_manager._get_node_type(view) == WorkerType.BURST
 
     def test_get_node_type_permanent(self, worker_manager):
         """Test identifying permanent worker type"""
@@ -157,7 +151,8 @@ class TestWorkerManager:
                 "labels": {}
             }
         }
-        assert worker_manager._get_node_type(node) == WorkerType.PERMANENT
+        view = worker_manager._to_view(node)
+        assert worker_manager._get_node_type(view) == WorkerType.PERMANENT
 
     def test_get_node_status_ready(self, worker_manager):
         """Test node status detection - ready"""
@@ -169,7 +164,8 @@ class TestWorkerManager:
                 ]
             }
         }
-        assert worker_manager._get_node_status(node) == WorkerStatus.READY
+        view = worker_manager._to_view(node)
+        assert worker_manager._get_node_status(view) == WorkerStatus.READY
 
     def test_get_node_status_draining(self, worker_manager):
         """Test node status detection - draining"""
@@ -181,7 +177,8 @@ class TestWorkerManager:
                 ]
             }
         }
-        assert worker_manager._get_node_status(node) == WorkerStatus.DRAINING
+        view = worker_manager._to_view(node)
+        assert worker_manager._get_node_status(view) == WorkerStatus.DRAINING
 
     def test_provision_workers_validation(self, worker_manager):
         """Test provision_workers input validation"""
@@ -214,14 +211,9 @@ class TestWorkerManager:
             pass
 
     @patch('worker_manager.subprocess.run')
-    def test_drain_worker(self, mock_run, worker_manager, mock_kubectl_nodes):
+    def test_drain_worker(self, mock_run, worker_manager):
         """Test draining a worker"""
-        # Mock kubectl get node
-        single_node = {"items": [mock_kubectl_nodes["items"][1]]}
-        mock_run.side_effect = [
-            Mock(stdout=json.dumps(single_node["items"][0]), returncode=0),
-            Mock(stdout="node drained", returncode=0)
-        ]
+        mock_run.return_value = Mock(stdout=b"node drained", returncode=0)
 
         result = worker_manager.drain_worker("burst-worker-1")
 
@@ -232,83 +224,63 @@ class TestWorkerManager:
     @patch('worker_manager.subprocess.run')
     def test_drain_worker_not_found(self, mock_run, worker_manager):
         """Test draining a non-existent worker"""
-        mock_run.side_effect = Exception("Node not found")
+        import subprocess
+        mock_run.side_effect = subprocess.CalledProcessError(
+            returncode=1,
+            cmd=["kubectl", "drain"],
+            stderr=b'Error from server (NotFound): nodes "non-existent-worker" not found'
+        )
 
-        with pytest.raises(WorkerManagerError):
+        with pytest.raises(WorkerManagerError, match="Failed to drain"):
             worker_manager.drain_worker("non-existent-worker")
 
-    @patch('worker_manager.subprocess.run')
-    def test_destroy_burst_worker(self, mock_run, worker_manager, mock_kubectl_nodes):
+    @patch('worker_manager.WorkerManager._delete_node')
+    @patch('worker_manager.WorkerManager._fetch_node')
+    def test_destroy_burst_worker(self, mock_fetch, mock_delete, worker_manager, mock_kubectl_nodes):
         """Test destroying a burst worker"""
-        # Mock kubectl get node (burst worker)
         burst_node = mock_kubectl_nodes["items"][1]
         burst_node["spec"]["unschedulable"] = True  # Make it drained
-
-        mock_run.side_effect = [
-            Mock(stdout=json.dumps(burst_node), returncode=0),  # get node
-            Mock(stdout="node deleted", returncode=0)  # delete node
-        ]
+        mock_fetch.return_value = burst_node
 
         result = worker_manager.destroy_worker("burst-worker-1")
 
+        mock_delete.assert_called_once_with("burst-worker-1")
+
         assert result['worker_id'] == "burst-worker-1"
         assert result['status'] in ["destroyed", "partial_destroy"]
         assert result['removed_from_cluster'] == True
 
-    @patch('worker_manager.subprocess.run')
-    def test_destroy_permanent_worker_blocked(self, mock_run, worker_manager, mock_kubectl_nodes):
+    @patch('worker_manager.WorkerManager._fetch_node')
+    def test_destroy_permanent_worker_blocked(self, mock_fetch, worker_manager, mock_kubectl_nodes):
         """Test that destroying a permanent worker is blocked"""
-        # Mock kubectl get node (permanent worker)
-        permanent_node = mock_kubectl_nodes["items"][0]
-
-        mock_run.return_value = Mock(
-            stdout=json.dumps(permanent_node),
-            returncode=0
-        )
+        mock_fetch.return_value = mock_kubectl_nodes["items"][0]
 
         with pytest.raises(WorkerManagerError, match="SAFETY VIOLATION"):
             worker_manager.destroy_worker("permanent-worker-1")
 
-    @patch('worker_manager.subprocess.run')
-    def test_destroy_worker_not_drained(self, mock_run, worker_manager, mock_kubectl_nodes):
+    @patch('worker_manager.WorkerManager._fetch_node')
+    def test_destroy_worker_not_drained(self, mock_fetch, worker_manager, mock_kubectl_nodes):
         """Test that destroying an undrained worker fails"""
-        # Mock kubectl get node (burst worker, not drained)
-        burst_node = mock_kubectl_nodes["items"][1]
-
-        mock_run.return_value = Mock(
-            stdout=json.dumps(burst_node),
-            returncode=0
-        )
+        mock_fetch.return_value = mock_kubectl_nodes["items"][1]
 
         with pytest.raises(WorkerManagerError, match="not drained"):
             worker_manager.destroy_worker("burst-worker-1")
 
-    @patch('worker_manager.subprocess.run')
-    def test_destroy_worker_force(self, mock_run, worker_manager, mock_kubectl_nodes):
+    @patch('worker_manager.WorkerManager._delete_node')
+    @patch('worker_manager.WorkerManager._fetch_node')
+    def test_destroy_worker_force(self, mock_fetch, mock_delete, worker_manager, mock_kubectl_nodes):
         """Test force destroying a worker without draining"""
-        # Mock kubectl get node (burst worker, not drained)
-        burst_node = mock_kubectl_nodes["items"][1]
-
-        mock_run.side_effect = [
-            Mock(stdout=json.dumps(burst_node), returncode=0),  # get node
-            Mock(stdout="node deleted", returncode=0)  # delete node
-        ]
+        mock_fetch.return_value = mock_kubectl_nodes["items"][1]
 
         result = worker_manager.destroy_worker("burst-worker-1", force=True)
 
         assert result['worker_id'] == "burst-worker-1"
         assert result['removed_from_cluster'] == True
 
-    @patch('worker_manager.subprocess.run')
-    def test_get_worker_details(self, mock_run, worker_manager, mock_kubectl_nodes):
+    @patch('worker_manager.WorkerManager._fetch_node')
+    def test_get_worker_details(self, mock_fetch, worker_manager, mock_kubectl_nodes):
         """Test getting detailed worker information"""
-        # Mock kubectl get node
-        burst_node = mock_kubectl_nodes["items"][1]
-
-        mock_run.return_value = Mock(
-            stdout=json.dumps(burst_node),
-            returncode=0
-        )
+        mock_fetch.return_value = mock_kubectl_nodes["items"][1]
 
         details = worker_manager.get_worker_details("burst-worker-1")
 
@@ -318,10 +290,33 @@ class TestWorkerManager:
         assert 'conditions' in details
         assert 'ttl_expires' in details
 
-    @patch('worker_manager.subprocess.run')
-    def test_get_worker_details_not_found(self, mock_run, worker_manager):
+    @patch('worker_manager.WorkerManager._fetch_nodes')
+    def test_list_workers_served_from_cache(self, mock_fetch, worker_manager, mock_kubectl_nodes):
+        """Test that a repeated listing inside the TTL reuses the cache"""
+        mock_fetch.return_value = mock_kubectl_nodes["items"]
+
+        first = worker_manager.list_workers()
+        second = worker_manager.list_workers()
+
+        assert [w['name'] for w in first] == [w['name'] for w in second]
+        assert mock_fetch.call_count == 1
+
+    @patch('worker_manager.WorkerManager._fetch_nodes')
+    def test_get_worker_details_served_from_cache(self, mock_fetch, worker_manager, mock_kubectl_nodes):
+        """Test that details after a fresh list don't re-hit the API"""
+        mock_fetch.return_value = mock_kubectl_nodes["items"]
+
+        worker_manager.list_workers()
+        details = worker_manager.get_worker_details("burst-worker-1")
+
+        assert details['name'] == "burst-worker-1"
+        # One call for the list; the detail lookup hit the node cache
+        assert mock_fetch.call_count == 1
+
+    @patch('worker_manager.WorkerManager._fetch_node')
+    def test_get_worker_details_not_found(self, mock_fetch, worker_manager):
         """Test getting details for non-existent worker"""
-        mock_run.side_effect = Exception("Node not found")
+        mock_fetch.side_effect = WorkerManagerError("Worker non-existent-worker not found")
 
         with pytest.raises(WorkerManagerError):
             worker_manager.get_worker_details("non-existent-worker")
@@ -334,13 +329,14 @@ class TestWorkerManager:
 
         # Verify structure
         for size in ["small", "medium", "large"]:
-            assert "cpu" in WORKER_SIZES[size]
-            assert "memory_gb" in WORKER_SIZES[size]
-            assert "disk_gb" in WORKER_SIZES[size]
+            spec = WORKER_SIZES[size]
+            assert spec.cpu > 0
+            assert spec.memory_gb > 0
+            assert spec.disk_gb > 0
 
         # Verify size ordering
-        assert WORKER_SIZES["small"]["cpu"] < WORKER_SIZES["medium"]["cpu"]
-        assert WORKER_SIZES["medium"]["cpu"] < WORKER_SIZES["large"]["cpu"]
+        assert WORKER_SIZES["small"].cpu < WORKER_SIZES["medium"].cpu
+        assert WORKER_SIZES["medium"].cpu < WORKER_SIZES["large"].cpu
 
 
 if __name__ == "__main__":